@@ -3,8 +3,9 @@ Rendering system for the game
 """
 
 import pygame
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional
 import os
+from utils.fonts import get_font
 
 
 class Renderer:
@@ -14,6 +15,9 @@ class Renderer:
         self.surface = surface
         self.width, self.height = surface.get_size()
 
+        # Surface.fblits (pygame-ce) skips the per-item unpacking and result list of blits
+        self._fblits = getattr(surface, 'fblits', None)
+
         # Font cache
         self.fonts: Dict[str, pygame.font.Font] = {}
         self._load_fonts()
@@ -24,17 +28,10 @@ class Renderer:
 
     def _load_fonts(self) -> None:
         """Load default fonts"""
-        try:
-            self.fonts['small'] = pygame.font.SysFont('Arial', 16)
-            self.fonts['small_bold'] = pygame.font.SysFont('Arial', 16, bold=True)
-            self.fonts['medium'] = pygame.font.SysFont('Arial', 20)
-            self.fonts['large'] = pygame.font.SysFont('Arial', 24)
-        except:
-            # Fallback if system fonts fail
-            pygame.font.init()
-            self.fonts['small'] = pygame.font.Font(None, 16)
-            self.fonts['medium'] = pygame.font.Font(None, 20)
-            self.fonts['large'] = pygame.font.Font(None, 24)
+        self.fonts['small'] = get_font('Arial', 16)
+        self.fonts['small_bold'] = get_font('Arial', 16, bold=True)
+        self.fonts['medium'] = get_font('Arial', 20)
+        self.fonts['large'] = get_font('Arial', 24)
 
     def render_background(self, background_name: str) -> None:
         """Render background image"""
@@ -245,6 +242,13 @@ class Renderer:
         """Fill a rectangle"""
         pygame.draw.rect(self.surface, color, rect)
 
+    def blit_surfaces(self, blit_sequence: List[Tuple[pygame.Surface, Tuple[int, int]]]) -> None:
+        """Blit several (surface, position) pairs in one call"""
+        if self._fblits is not None:
+            self._fblits(blit_sequence)
+        else:
+            self.surface.blits(blit_sequence, doreturn=False)
+
     def clear(self, color: Tuple[int, int, int] = (0, 0, 0)) -> None:
         """Clear the screen"""
         self.surface.fill(color)
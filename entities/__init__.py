@@ -4,6 +4,7 @@ Entities module - Game object definitions and management
 
 from .base_entity import BaseEntity
 from .game_entities import Door, Key, Table, Box, create_entity
+from .inventory_entry import InventoryEntry
 
 __all__ = [
     'BaseEntity',
@@ -11,5 +12,6 @@ __all__ = [
     'Key',
     'Table',
     'Box',
-    'create_entity'
+    'create_entity',
+    'InventoryEntry'
 ]
@@ -38,6 +38,15 @@ class BaseEntity:
     Uses component-based architecture for flexibility
     """
 
+    # Fixed slots for the attributes read in the scene hot loops; '__dict__' is
+    # kept because scripts (SET obj.prop) and the UI attach extra attributes at runtime
+    __slots__ = (
+        'id', 'name', 'position', 'properties', '_localization_manager',
+        'components', 'visible', 'interactive', 'state',
+        'allowed_actions', 'forbidden_actions', 'sprite', 'bounding_box',
+        '__dict__'
+    )
+
     def __init__(self, entity_id: str, name: str, position: Optional[Tuple[int, int]] = None, **properties):
         self.id = entity_id
         self.name = name
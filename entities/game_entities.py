@@ -5,6 +5,7 @@ Main game entities using the BaseEntity system
 
 from typing import Dict, Any, Optional, List
 from entities.base_entity import BaseEntity
+from entities.inventory_entry import InventoryEntry
 import pygame
 
 # Import localization manager
@@ -20,6 +21,8 @@ except ImportError:
 class Door(BaseEntity):
     """Door entity for the game"""
 
+    __slots__ = ('locked', 'key_required')
+
     def __init__(self, entity_id: str, name: str, position: Optional[tuple] = None,
                  width: int = 64, height: int = 128, locked: bool = False,
                  key_required: Optional[str] = None, **kwargs):
@@ -152,6 +155,8 @@ class Door(BaseEntity):
 class Key(BaseEntity):
     """Key entity for the game"""
 
+    __slots__ = ('description',)
+
     def __init__(self, entity_id: str, name: str, position: Optional[tuple] = None,
                  width: int = 32, height: int = 32, description: str = "en laiton qui brille faiblement dans la lumière ambiante, avec des gravures complexes sur sa surface", **kwargs):
         super().__init__(
@@ -214,10 +219,7 @@ class Key(BaseEntity):
         # Add the key to the player's inventory
         if 'inventory' not in game_context:
             game_context['inventory'] = []
-        game_context['inventory'].append({
-            'id': self.id,
-            'name': self.name
-        })
+        game_context['inventory'].append(InventoryEntry(self.id, self.name))
 
         self._show_message_above("J'ai la clé en laiton, à voir quelle porte elle peut ouvrir...", game_context, 3000)
         return None
@@ -281,6 +283,8 @@ class Key(BaseEntity):
 class Table(BaseEntity):
     """Table entity for the game"""
 
+    __slots__ = ('items_on_top', 'items_underneath', 'has_been_moved')
+
     def __init__(self, entity_id: str, name: str, position: Optional[tuple] = None,
                  width: int = 96, height: int = 64, items_on_top: Optional[List[str]] = None,
                  items_underneath: Optional[List[str]] = None, **kwargs):
@@ -426,6 +430,8 @@ class Table(BaseEntity):
 class Box(BaseEntity):
     """Box entity that can be opened/closed"""
 
+    __slots__ = ('is_open', 'contents')
+
     def __init__(self, entity_id: str, name: str, position: Optional[tuple] = None,
                  width: int = 48, height: int = 48, is_open: bool = False, 
                  contents: Optional[List[str]] = None):
@@ -536,6 +542,8 @@ class Box(BaseEntity):
 class Buisson(BaseEntity):
     """Buisson entity for the garden scene"""
 
+    __slots__ = ()
+
     def __init__(self, entity_id: str, name: str, position: Optional[tuple] = None,
                  width: int = 80, height: int = 60, **kwargs):
         super().__init__(
@@ -567,6 +575,8 @@ class Buisson(BaseEntity):
 class Fontaine(BaseEntity):
     """Fontaine entity for the garden scene"""
 
+    __slots__ = ()
+
     def __init__(self, entity_id: str, name: str, position: Optional[tuple] = None,
                  width: int = 96, height: int = 96, **kwargs):
         super().__init__(
@@ -598,6 +608,8 @@ class Fontaine(BaseEntity):
 class Coffre(BaseEntity):
     """Coffre entity for the garden scene"""
 
+    __slots__ = ('locked',)
+
     def __init__(self, entity_id: str, name: str, position: Optional[tuple] = None,
                  width: int = 64, height: int = 48, locked: bool = True, **kwargs):
         super().__init__(
@@ -640,6 +652,8 @@ class Coffre(BaseEntity):
 class Coffre(BaseEntity):
     """Coffre entity for the garden scene"""
 
+    __slots__ = ('locked',)
+
     def __init__(self, entity_id: str, name: str, position: Optional[tuple] = None,
                  width: int = 64, height: int = 48, locked: bool = True, **kwargs):
         super().__init__(
@@ -730,6 +744,8 @@ class Coffre(BaseEntity):
 class Crystal(BaseEntity):
     """Crystal entity for the treasure chamber"""
 
+    __slots__ = ('activated',)
+
     def __init__(self, entity_id: str, name: str, position: Optional[tuple] = None,
                  width: int = 48, height: int = 48, activated: bool = False, **kwargs):
         super().__init__(
@@ -804,6 +820,8 @@ class Crystal(BaseEntity):
 class AncientBook(BaseEntity):
     """Ancient book entity for the treasure chamber"""
 
+    __slots__ = ('opened',)
+
     def __init__(self, entity_id: str, name: str, position: Optional[tuple] = None,
                  width: int = 48, height: int = 32, opened: bool = False, **kwargs):
         super().__init__(
@@ -879,6 +897,8 @@ class AncientBook(BaseEntity):
 class Pedestal(BaseEntity):
     """Pedestal entity for the treasure chamber"""
 
+    __slots__ = ()
+
     def __init__(self, entity_id: str, name: str, position: Optional[tuple] = None,
                  width: int = 48, height: int = 48, **kwargs):
         super().__init__(
@@ -922,6 +942,8 @@ class Pedestal(BaseEntity):
 class ExitPortal(BaseEntity):
     """Exit portal entity for the treasure chamber"""
 
+    __slots__ = ('inactive',)
+
     def __init__(self, entity_id: str, name: str, position: Optional[tuple] = None,
                  width: int = 64, height: int = 96, inactive: bool = True, **kwargs):
         super().__init__(
@@ -992,6 +1014,8 @@ class ExitPortal(BaseEntity):
 class MysteriousKey(BaseEntity):
     """Mysterious key entity for the treasure chamber"""
 
+    __slots__ = ()
+
     def __init__(self, entity_id: str, name: str, position: Optional[tuple] = None,
                  width: int = 32, height: int = 32, **kwargs):
         super().__init__(
@@ -1033,10 +1057,7 @@ class MysteriousKey(BaseEntity):
         # Add the key to the player's inventory
         if 'inventory' not in game_context:
             game_context['inventory'] = []
-        game_context['inventory'].append({
-            'id': self.id,
-            'name': self.name
-        })
+        game_context['inventory'].append(InventoryEntry(self.id, self.name))
 
         self._show_message_above("Vous prenez la clé mystérieuse. Elle pulse d'une lumière étrange.", game_context, 3000)
         return None
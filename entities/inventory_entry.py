@@ -0,0 +1,32 @@
+"""
+Inventory entries stored in the shared game context
+"""
+
+from typing import Any
+
+
+class InventoryEntry:
+    """Lightweight (id, name) entry of the shared context inventory
+
+    Fields are plain slotted attributes for the UI hot paths; get() and item access
+    keep the former dict-based API working for callers that still use it.
+    """
+
+    __slots__ = ('id', 'name')
+
+    def __init__(self, item_id: str, name: str):
+        self.id = item_id
+        self.name = name
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style access to a field"""
+        return getattr(self, key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __repr__(self) -> str:
+        return f"InventoryEntry(id={self.id!r}, name={self.name!r})"
@@ -5,7 +5,17 @@ Permet la traduction de tous les textes selon la langue choisie
 
 import json
 import os
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
+
+# orjson est optionnel : parseur C plus rapide, repli sur json sinon
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# En dessous de ce nombre de fichiers, lire un à un coûte moins que démarrer des threads
+PARALLEL_LOAD_THRESHOLD = 8
 
 # Variable globale pour le singleton
 _localization_manager = None
@@ -28,19 +38,41 @@ class LocalizationManager:
         if not os.path.exists(self.locales_dir):
             print(f"Warning: Locales directory not found: {self.locales_dir}")
             return
-            
-        for filename in os.listdir(self.locales_dir):
-            if filename.endswith('.json'):
-                language_code = filename[:-5]  # Remove .json extension
-                filepath = os.path.join(self.locales_dir, filename)
-                
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        self.translations[language_code] = json.load(f)
-                    # print(f"Loaded translations for language: {language_code}")  # Commenté pour éviter le spam
-                except Exception as e:
-                    print(f"Error loading translations for {language_code}: {e}")
-    
+
+        filenames = [f for f in os.listdir(self.locales_dir) if f.endswith('.json')]
+        self.load_languages([filename[:-5] for filename in filenames])  # Remove .json extension
+
+    def load_languages(self, language_codes: List[str]) -> None:
+        """Charger plusieurs fichiers de traduction
+
+        Les fichiers sont lus un à un, sauf s'ils sont nombreux : les lectures disque sont
+        alors superposées dans un pool de threads.
+        """
+        if not language_codes:
+            return
+
+        if len(language_codes) < PARALLEL_LOAD_THRESHOLD:
+            results = [self._load_one(language_code) for language_code in language_codes]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(language_codes))) as executor:
+                results = list(executor.map(self._load_one, language_codes))
+
+        # Fusionner séquentiellement pour garder un ordre déterministe
+        for language_code, data in results:
+            if data is not None:
+                self.translations[language_code] = data
+
+    def _load_one(self, language_code: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Charger un fichier de traduction, retourne (code, données) ou (code, None) en cas d'erreur"""
+        filepath = os.path.join(self.locales_dir, f"{language_code}.json")
+        try:
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            return language_code, orjson.loads(raw) if orjson else json.loads(raw)
+        except Exception as e:
+            print(f"Error loading translations for {language_code}: {e}")
+            return language_code, None
+
     def set_language(self, language_code: str) -> bool:
         """Changer la langue courante"""
         if language_code in self.translations:
@@ -49,6 +49,7 @@ class PointClickGame(Game):
         self.clock = pygame.time.Clock()
         self.fps = 60
         self.show_debug_ids = False  # Affichage des codes d'objets (F1)
+        self._overlay_drawn = False  # Notifications dessinées par-dessus l'interface à la frame précédente
 
         # Contexte partagé
         self.context: Dict[str, Any] = {
@@ -376,9 +377,7 @@ class PointClickGame(Game):
     def _get_clicked_entity(self, pos):
         """Trouve l'entité cliquée à la position donnée"""
         if self.scene_manager.current_scene:
-            for entity in self.scene_manager.current_scene.entities:
-                if entity.visible and entity.bounding_box.collidepoint(pos):
-                    return entity
+            return self.scene_manager.current_scene.get_entity_at(pos)
         return None
 
     def _create_inventory_entity(self, inventory_item):
@@ -636,13 +635,13 @@ class PointClickGame(Game):
         if self.scene_manager.current_scene:
             self.scene_manager.current_scene.update(delta_time)
 
+        # Nettoyer les descriptions temporaires (avant que l'interface ne les relève)
+        self._update_temp_descriptions()
+
         # Mettre à jour l'interface
         if self.interface:
             self.interface.update(self.context)
 
-        # Nettoyer les descriptions temporaires
-        self._update_temp_descriptions()
-
     def _update_temp_descriptions(self):
         """Nettoyer les descriptions temporaires expirées"""
         current_time = pygame.time.get_ticks()
@@ -658,25 +657,44 @@ class PointClickGame(Game):
 
     def render(self):
         """Rendre le jeu"""
-        # Effacer l'écran seulement si la scène actuelle n'a pas d'image de fond
+        # Zones de l'écran à rafraîchir : la scène est redessinée à chaque frame,
+        # l'interface n'ajoute que les panneaux qui ont changé
+        dirty_rects = [self.interface.SCENE_RECT] if self.interface else None
+
+        # Rendre la scène (elle couvre toute sa zone, fond ou couleur par défaut)
         current_scene = self.scene_manager.current_scene
-        if not (current_scene and hasattr(current_scene, 'background_image') and current_scene.background_image):
+        if current_scene:
+            # Limiter le dessin à la zone de scène : une entité qui déborde ne doit pas
+            # toucher les panneaux de l'interface, qui ne sont pas forcément redessinés
+            if self.interface:
+                self.renderer.surface.set_clip(self.interface.SCENE_RECT)
+            try:
+                current_scene.render(self.renderer, self.context)
+            finally:
+                self.renderer.surface.set_clip(None)
+        else:
             self.renderer.clear()
-
-        # Rendre la scène
-        if self.scene_manager.current_scene:
-            self.scene_manager.current_scene.render(self.renderer, self.context)
+            dirty_rects = None
+        self.context['dirty_rects'] = dirty_rects
 
         # Rendre l'interface
         if self.interface:
+            if dirty_rects is None or self._overlay_drawn:
+                # Quelque chose a été dessiné par-dessus les panneaux : tout redessiner
+                self.interface.invalidate()
             self.interface.render(self.renderer, self.context)
 
         # Rendre les notifications
-        if self.notification_system:
+        self._overlay_drawn = False
+        if self.notification_system and self.notification_system.notifications:
             self.notification_system.render(self.renderer)
+            self._overlay_drawn = True
 
         # Mettre à jour l'affichage
-        pygame.display.flip()
+        if dirty_rects is None or self._overlay_drawn:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
 
     def run(self):
         """Boucle principale du jeu"""
@@ -4,9 +4,9 @@ Moteur pour interpréter les scripts naturels de jeu d'aventure
 """
 
 import re
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
-from entities import Door, Key, Table, BaseEntity
+from entities import Door, Key, Table, BaseEntity, InventoryEntry
 
 
 @dataclass
@@ -46,6 +46,7 @@ class NaturalScriptEngine:
         self.forbidden_actions: Dict[str, str] = {}
         self.game_state: Dict[str, Any] = {}
         self.current_scene_id = ""
+        self._compiled_conditions: Dict[str, Callable[[], bool]] = {}  # Conditions compilées en closures
         
     def parse_script(self, script_path: str):
         """Parse le script naturel"""
@@ -164,6 +165,7 @@ class NaturalScriptEngine:
                 if subline.startswith('REQUIRES:'):
                     req = subline[9:].strip()
                     action.requires.append(req)
+                    self._precompile_condition(req)
                 elif subline.startswith('EFFECTS:'):
                     pass  # Ignorer la ligne d'en-tête
                 elif subline.startswith('- '):
@@ -239,63 +241,87 @@ class NaturalScriptEngine:
     def check_action_requirements(self, action: GameAction) -> bool:
         """Vérifie si les prérequis d'une action sont remplis"""
         for req in action.requires:
-            if not self._evaluate_condition(req):
+            if not self._get_compiled_condition(req)():
                 return False
         return True
     
     def _evaluate_condition(self, condition: str) -> bool:
         """Évalue une condition (ex: "table.moved = true", "key IN inventory")"""
+        return self._get_compiled_condition(condition)()
+
+    def _precompile_condition(self, condition: str) -> None:
+        """Compile une condition au chargement du script (les erreurs restent signalées à l'évaluation)"""
+        try:
+            self._get_compiled_condition(condition)
+        except ValueError:
+            pass
+
+    def _get_compiled_condition(self, condition: str) -> Callable[[], bool]:
+        """Retourne la closure compilée pour une condition, en la compilant au premier appel"""
+        compiled = self._compiled_conditions.get(condition)
+        if compiled is None:
+            compiled = self._compile_condition(condition)
+            self._compiled_conditions[condition] = compiled
+        return compiled
+
+    def _compile_condition(self, condition: str) -> Callable[[], bool]:
+        """Analyse une condition une seule fois et retourne une closure sans argument qui l'évalue"""
         condition = condition.strip()
+        game_context = self.game_context
         
         if ' IN inventory' in condition:
             obj_id = condition.replace(' IN inventory', '')
-            inventory = self.game_context.get('inventory', [])
-            return any(item.get('id') == obj_id for item in inventory)
+
+            def in_inventory() -> bool:
+                inventory = game_context.get('inventory', [])
+                return any(item.id == obj_id for item in inventory)
+            return in_inventory
         
         # Support pour != et =
         if '!=' in condition:
             left, right = condition.split('!=', 1)
             obj_prop, prop_name = left.strip().split('.')
-            expected_value = right.strip()
-            
-            # Convertir la valeur attendue
-            if expected_value.lower() == 'true':
-                expected_value = True
-            elif expected_value.lower() == 'false':
-                expected_value = False
-            
-            # Vérifier la propriété de l'objet
-            current_scene = self.game_context.get('current_scene')
-            if current_scene:
-                for entity in current_scene.entities:
-                    if entity.id == obj_prop:
-                        actual_value = getattr(entity, prop_name, None)
-                        # Pour !=, si la propriété n'existe pas (None), on considère que c'est différent de la valeur attendue
-                        if actual_value is None:
-                            return expected_value is not None
-                        return actual_value != expected_value
-            return True  # Si l'objet n'existe pas, on considère que la condition != est vraie
+            expected_value = self._convert_condition_value(right.strip())
+
+            def not_equals() -> bool:
+                # Vérifier la propriété de l'objet
+                current_scene = game_context.get('current_scene')
+                if current_scene:
+                    for entity in current_scene.entities:
+                        if entity.id == obj_prop:
+                            actual_value = getattr(entity, prop_name, None)
+                            # Pour !=, si la propriété n'existe pas (None), on considère que c'est différent de la valeur attendue
+                            if actual_value is None:
+                                return expected_value is not None
+                            return actual_value != expected_value
+                return True  # Si l'objet n'existe pas, on considère que la condition != est vraie
+            return not_equals
             
         elif '=' in condition:
             left, right = condition.split('=', 1)
             obj_prop, prop_name = left.strip().split('.')
-            expected_value = right.strip()
-            
-            # Convertir la valeur attendue
-            if expected_value.lower() == 'true':
-                expected_value = True
-            elif expected_value.lower() == 'false':
-                expected_value = False
-            
-            # Vérifier la propriété de l'objet
-            current_scene = self.game_context.get('current_scene')
-            if current_scene:
-                for entity in current_scene.entities:
-                    if entity.id == obj_prop:
-                        actual_value = getattr(entity, prop_name, None)
-                        return actual_value == expected_value
+            expected_value = self._convert_condition_value(right.strip())
+
+            def equals() -> bool:
+                # Vérifier la propriété de l'objet
+                current_scene = game_context.get('current_scene')
+                if current_scene:
+                    for entity in current_scene.entities:
+                        if entity.id == obj_prop:
+                            actual_value = getattr(entity, prop_name, None)
+                            return actual_value == expected_value
+                return False
+            return equals
         
-        return False
+        return lambda: False
+
+    def _convert_condition_value(self, expected_value: str) -> Any:
+        """Convertir la valeur attendue d'une condition"""
+        if expected_value.lower() == 'true':
+            return True
+        elif expected_value.lower() == 'false':
+            return False
+        return expected_value
     
     def execute_action_effects(self, action: GameAction):
         """Exécute les effets d'une action"""
@@ -362,10 +388,7 @@ class NaturalScriptEngine:
                 if entity.id == obj_id:
                     if 'inventory' not in self.game_context:
                         self.game_context['inventory'] = []
-                    self.game_context['inventory'].append({
-                        'id': entity.id,
-                        'name': entity.name
-                    })
+                    self.game_context['inventory'].append(InventoryEntry(entity.id, entity.name))
                     entity.visible = False
                     break
     
@@ -18,6 +18,10 @@ class Scene:
         self.entities = []
         self.background_color = (75, 126, 165)  # Sky blue
         self.background_image = None  # Image de fond
+        self._entity_surface_cache = {}  # (type, [état, verrouillée,] largeur, hauteur) -> Surface
+        self._renderer_has_text = None  # Résolu au premier rendu
+        self._entity_rects = []  # Références aux bounding_box, dans l'ordre de self.entities
+        self._point_rect = pygame.Rect(0, 0, 1, 1)  # Rect 1x1 réutilisé pour les tests de collision
         
         # Charger l'image de fond si spécifiée
         if 'background' in scene_data:
@@ -28,7 +32,6 @@ class Scene:
 
     def load_background(self, background_path: str):
         """Charger une image de fond"""
-        import pygame
         try:
             self.background_image = pygame.image.load(background_path)
             # Redimensionner l'image pour qu'elle fasse 800x450 (taille de la scène)
@@ -47,6 +50,21 @@ class Scene:
             if entity:
                 self.entities.append(entity)
 
+        # Les bounding_box sont modifiées sur place : la liste reste synchronisée
+        self._entity_rects = [entity.bounding_box for entity in self.entities]
+
+    def _entities_at(self, pos):
+        """Itérer sur les entités visibles sous la position, dans l'ordre de la scène"""
+        self._point_rect.topleft = pos
+        for index in self._point_rect.collidelistall(self._entity_rects):
+            entity = self.entities[index]
+            if entity.visible:
+                yield entity
+
+    def get_entity_at(self, pos):
+        """Retourner la première entité visible sous la position donnée"""
+        return next(self._entities_at(pos), None)
+
     def create_entity_from_data(self, entity_data: Dict[str, Any]) -> Optional[Any]:
         """Créer une entité à partir des données"""
         entity_type = entity_data.get('type', 'unknown')
@@ -142,43 +160,70 @@ class Scene:
             # Afficher l'image de fond
             renderer.surface.blit(self.background_image, (0, 0))
         else:
-            # Afficher la couleur de fond par défaut
-            renderer.fill_rect(pygame.Rect(0, 0, 800, 600), self.background_color)
+            # Afficher la couleur de fond par défaut (zone de scène uniquement, l'interface couvre le bas)
+            renderer.fill_rect(pygame.Rect(0, 0, 800, 450), self.background_color)
 
-        # Rendre les entités
-        for entity in self.entities:
-            if entity.visible:
-                # Couleurs selon le type d'entité
-                if isinstance(entity, Door):
-                    # Rendu spécial pour les portes selon leur état
-                    self._render_door(renderer, entity)
-                elif isinstance(entity, Key):
-                    color = (255, 215, 0)  # Or pour les clés
-                    renderer.fill_rect(entity.bounding_box, color)
-                    renderer.draw_rect(entity.bounding_box, (0, 0, 0), 2)
-                elif isinstance(entity, Table):
-                    color = (160, 82, 45)  # Marron clair pour les tables
-                    renderer.fill_rect(entity.bounding_box, color)
-                    renderer.draw_rect(entity.bounding_box, (0, 0, 0), 2)
-                else:
-                    color = (128, 128, 128)  # Gris par défaut
-                    renderer.fill_rect(entity.bounding_box, color)
-                    renderer.draw_rect(entity.bounding_box, (0, 0, 0), 2)
-
-                # Afficher l'ID pour le débogage (conditionnel avec F1)
-                if context and context.get('show_debug_ids', False) and hasattr(renderer, 'render_text'):
-                    renderer.render_text(
-                        entity.id,
-                        (entity.bounding_box.centerx, entity.bounding_box.top - 15),
-                        font_name='small',
-                        center=True
-                    )
-
-    def _render_door(self, renderer, door):
-        """Rendre une porte selon son état"""
-        door_rect = door.bounding_box
-        
-        if door.state == "open":
+        # Le type de renderer ne change pas d'une frame à l'autre
+        if self._renderer_has_text is None:
+            self._renderer_has_text = hasattr(renderer, 'render_text')
+        show_debug = bool(context and context.get('show_debug_ids')) and self._renderer_has_text
+
+        # Rendre les entités : une surface pré-rendue par aspect, envoyées en un seul appel blits.
+        # L'ordre de la scène est conservé (la clé est posée sur la table).
+        visible_entities = [entity for entity in self.entities if entity.visible]
+        renderer.blit_surfaces(
+            [(self._get_entity_surface(entity), entity.bounding_box.topleft) for entity in visible_entities]
+        )
+
+        # Afficher l'ID pour le débogage (conditionnel avec F1)
+        if show_debug:
+            for entity in visible_entities:
+                bb = entity.bounding_box
+                renderer.render_text(
+                    entity.id,
+                    (bb.centerx, bb.top - 15),
+                    font_name='small',
+                    center=True
+                )
+
+    def _get_entity_surface(self, entity) -> pygame.Surface:
+        """Retourner la surface pré-rendue d'une entité (mise en cache par aspect et taille)"""
+        bb = entity.bounding_box
+        if isinstance(entity, Door):
+            cache_key = (Door, entity.state, entity.locked, bb.width, bb.height)
+        else:
+            cache_key = (type(entity), bb.width, bb.height)
+        surface = self._entity_surface_cache.get(cache_key)
+        if surface is None:
+            if isinstance(entity, Door):
+                # Rendu spécial pour les portes selon leur état
+                surface = self._build_door_surface(entity.state, entity.locked, bb.width, bb.height)
+            else:
+                surface = self._build_entity_surface(entity, bb.width, bb.height)
+            self._entity_surface_cache[cache_key] = surface
+        return surface
+
+    def _build_entity_surface(self, entity, width: int, height: int) -> pygame.Surface:
+        """Dessiner une fois le rectangle coloré d'une entité simple"""
+        # Couleurs selon le type d'entité
+        if isinstance(entity, Key):
+            color = (255, 215, 0)  # Or pour les clés
+        elif isinstance(entity, Table):
+            color = (160, 82, 45)  # Marron clair pour les tables
+        else:
+            color = (128, 128, 128)  # Gris par défaut
+        surface = pygame.Surface((width, height))
+        rect = surface.get_rect()
+        pygame.draw.rect(surface, color, rect)
+        pygame.draw.rect(surface, (0, 0, 0), rect, 2)
+        return surface
+
+    def _build_door_surface(self, state: str, locked: bool, width: int, height: int) -> pygame.Surface:
+        """Dessiner une fois l'aspect d'une porte (ouverte, verrouillée ou fermée)"""
+        surface = pygame.Surface((width, height))
+        door_rect = surface.get_rect()
+
+        if state == "open":
             # Porte ouverte : afficher une porte entrouverte (décalée)
             # Porte principale plus fine (ouverte vers la droite)
             open_width = door_rect.width // 3
@@ -188,12 +233,12 @@ class Scene:
                 open_width,
                 door_rect.height
             )
-            
+
             # Couleur plus claire pour une porte ouverte
             door_color = (160, 100, 50)  # Marron clair
-            renderer.fill_rect(open_rect, door_color)
-            renderer.draw_rect(open_rect, (0, 0, 0), 2)
-            
+            pygame.draw.rect(surface, door_color, open_rect)
+            pygame.draw.rect(surface, (0, 0, 0), open_rect, 2)
+
             # Afficher l'espace ouvert (plus sombre)
             space_rect = pygame.Rect(
                 door_rect.x,
@@ -201,68 +246,70 @@ class Scene:
                 door_rect.width - open_width,
                 door_rect.height
             )
-            renderer.fill_rect(space_rect, (50, 30, 20))  # Très sombre pour l'ouverture
-            
-        elif door.locked:
+            pygame.draw.rect(surface, (50, 30, 20), space_rect)  # Très sombre pour l'ouverture
+
+        elif locked:
             # Porte verrouillée : couleur plus sombre avec un verrou
             door_color = (80, 40, 20)  # Marron très sombre
-            renderer.fill_rect(door_rect, door_color)
-            renderer.draw_rect(door_rect, (0, 0, 0), 3)  # Bordure plus épaisse
-            
+            pygame.draw.rect(surface, door_color, door_rect)
+            pygame.draw.rect(surface, (0, 0, 0), door_rect, 3)  # Bordure plus épaisse
+
             # Dessiner un verrou (petit rectangle doré au centre)
             lock_size = 8
             lock_x = door_rect.centerx - lock_size // 2
             lock_y = door_rect.centery - lock_size // 2
             lock_rect = pygame.Rect(lock_x, lock_y, lock_size, lock_size)
-            renderer.fill_rect(lock_rect, (255, 215, 0))  # Or
-            renderer.draw_rect(lock_rect, (0, 0, 0), 1)
-            
+            pygame.draw.rect(surface, (255, 215, 0), lock_rect)  # Or
+            pygame.draw.rect(surface, (0, 0, 0), lock_rect, 1)
+
         else:
             # Porte fermée : couleur normale
             door_color = (139, 69, 19)  # Marron normal
-            renderer.fill_rect(door_rect, door_color)
-            renderer.draw_rect(door_rect, (0, 0, 0), 2)
+            pygame.draw.rect(surface, door_color, door_rect)
+            pygame.draw.rect(surface, (0, 0, 0), door_rect, 2)
+
+        return surface
 
     def handle_click(self, pos, action=None):
         """Gérer les clics dans la scène"""
-        for entity in self.entities:
-            if entity.visible and entity.bounding_box.collidepoint(pos):
-                # Utiliser le contexte principal du jeu
-                context = self.game.context
-                
-                # Mettre à jour quelques informations spécifiques à cette interaction
-                context['current_scene_obj'] = {'objects': {e.id: e for e in self.entities}}
-
-                # Vérifier d'abord si le moteur de script naturel peut gérer cette action
-                if hasattr(self.game, 'script_engine') and self.game.script_engine and action:
-                    script_action = self.game.script_engine.find_action(action.lower(), entity.id)
-                    if script_action:
-                        # Afficher le message de l'action
-                        self._show_message_above(script_action.message, entity, context)
-                        # Exécuter les effets
-                        self.game.script_engine.execute_action_effects(script_action)
-                        # Nettoyer les sélections d'interface après l'exécution réussie
-                        if hasattr(self.game, 'interface') and self.game.interface:
-                            self.game.interface.clear_selections()
-                        return  # Ne pas passer au système classique
-                    else:
-                        # Vérifier si c'est une action interdite
-                        if action:
-                            forbidden_msg = self.game.script_engine.get_forbidden_message(action.lower(), entity.id)
-                            if forbidden_msg:
-                                self._show_message_above(forbidden_msg, entity, context)
-                                return  # Ne pas passer au système classique
-                        # Fallback vers le système d'entités classique
-                            message = entity.on_click(action, context)
-                            # Nettoyer les sélections après l'action classique
-                            if hasattr(self.game, 'interface') and self.game.interface:
-                                self.game.interface.clear_selections()
-                else:
-                    # Système classique si pas de moteur de script
-                    message = entity.on_click(action, context)
-                    # Nettoyer les sélections après l'action classique
+        action_lc = action.lower() if action else None
+        for entity in self._entities_at(pos):
+            # Utiliser le contexte principal du jeu
+            context = self.game.context
+            
+            # Mettre à jour quelques informations spécifiques à cette interaction
+            context['current_scene_obj'] = {'objects': {e.id: e for e in self.entities}}
+
+            # Vérifier d'abord si le moteur de script naturel peut gérer cette action
+            if hasattr(self.game, 'script_engine') and self.game.script_engine and action:
+                script_action = self.game.script_engine.find_action(action_lc, entity.id)
+                if script_action:
+                    # Afficher le message de l'action
+                    self._show_message_above(script_action.message, entity, context)
+                    # Exécuter les effets
+                    self.game.script_engine.execute_action_effects(script_action)
+                    # Nettoyer les sélections d'interface après l'exécution réussie
                     if hasattr(self.game, 'interface') and self.game.interface:
                         self.game.interface.clear_selections()
+                    return  # Ne pas passer au système classique
+                else:
+                    # Vérifier si c'est une action interdite
+                    if action:
+                        forbidden_msg = self.game.script_engine.get_forbidden_message(action_lc, entity.id)
+                        if forbidden_msg:
+                            self._show_message_above(forbidden_msg, entity, context)
+                            return  # Ne pas passer au système classique
+                    # Fallback vers le système d'entités classique
+                        message = entity.on_click(action, context)
+                        # Nettoyer les sélections après l'action classique
+                        if hasattr(self.game, 'interface') and self.game.interface:
+                            self.game.interface.clear_selections()
+            else:
+                # Système classique si pas de moteur de script
+                message = entity.on_click(action, context)
+                # Nettoyer les sélections après l'action classique
+                if hasattr(self.game, 'interface') and self.game.interface:
+                    self.game.interface.clear_selections()
 
     def _show_message_above(self, message: str, entity, context: Dict[str, Any], duration: int = 3000):
         """Affiche un message au-dessus d'une entité"""
@@ -279,15 +326,16 @@ class Scene:
 
     def handle_hover(self, pos):
         """Gérer le survol des entités dans la scène"""
-        for entity in self.entities:
-            if entity.visible and entity.bounding_box.collidepoint(pos):
-                # Vérifier si c'est une porte ouverte (pour changer le curseur)
-                if (entity.id == "door" and hasattr(entity, 'state') and 
-                    entity.state == "open"):
-                    # Retourner un tuple spécial pour indiquer la porte ouverte
-                    return ("door_open", "Aller vers le jardin secret")
-                elif entity.id == "return_door":
-                    # Porte de retour toujours accessible
-                    return ("door_open", "Retourner au hall")
-                return entity.name
-        return None
+        entity = self.get_entity_at(pos)
+        if entity is None:
+            return None
+
+        # Vérifier si c'est une porte ouverte (pour changer le curseur)
+        if (entity.id == "door" and hasattr(entity, 'state') and 
+            entity.state == "open"):
+            # Retourner un tuple spécial pour indiquer la porte ouverte
+            return ("door_open", "Aller vers le jardin secret")
+        elif entity.id == "return_door":
+            # Porte de retour toujours accessible
+            return ("door_open", "Retourner au hall")
+        return entity.name
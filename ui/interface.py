@@ -3,7 +3,68 @@ Main game interface
 """
 
 import pygame
-from typing import Dict, Any, Tuple, List
+from itertools import islice
+from operator import attrgetter, itemgetter
+from typing import Dict, Any, Tuple, List, Optional
+from utils.fonts import get_font
+from utils.logger import get_logger
+
+
+# Interface colors
+WHITE = (255, 255, 255)
+STATUS_BG = (20, 20, 20)
+LANG_BUTTON_BG = (60, 60, 100)
+LANG_BUTTON_HOVER_BG = (80, 80, 120)
+ACTION_AREA_BG = (40, 40, 40)
+ACTION_BUTTON_COLORS = ((60, 60, 60), (80, 80, 80), (100, 100, 100))  # Idle, hovered, selected
+INVENTORY_BG = (50, 50, 50)
+SLOT_BG = (70, 70, 70)
+SLOT_HOVER_BG = (85, 85, 85)
+SLOT_SELECTED_BG = (100, 100, 100)
+SLOT_EMPTY_BG = (30, 30, 30)
+SLOT_EMPTY_BORDER = (100, 100, 100)
+SCROLL_AREA_BG = (40, 40, 40)
+ARROW_BG = (60, 60, 60)
+ARROW_DISABLED = (100, 100, 100)
+KEY_GOLD = (255, 215, 0)
+KEY_GOLD_BORDER = (200, 180, 0)
+
+# Key icon bounds, relative to the center of the inventory cell
+KEY_ICON_ORIGIN = (-18, -6)
+KEY_ICON_SIZE = (28, 12)
+
+
+def _grid_rects(area: pygame.Rect, columns: int, rows: int, count: int) -> List[pygame.Rect]:
+    """Split an area into a row-major grid of equal cells"""
+    cell_width = area.width // columns
+    cell_height = area.height // rows
+    rects = []
+    for i in range(count):
+        row, col = divmod(i, columns)
+        rects.append(pygame.Rect(
+            area.left + col * cell_width,
+            area.top + row * cell_height,
+            cell_width,
+            cell_height
+        ))
+    return rects
+
+
+# (id, name) accessors for inventory entries: plain dicts, or objects exposing the same
+# attributes (InventoryEntry from the game context)
+_ITEM_FIELDS_FROM_DICT = itemgetter('id', 'name')
+_ITEM_FIELDS_FROM_ATTRS = attrgetter('id', 'name')
+
+
+def _item_fields_getter(inventory: List[Any]):
+    """Pick the (id, name) accessor matching the inventory entries (from the first one)"""
+    if inventory and not isinstance(inventory[0], dict):
+        return _ITEM_FIELDS_FROM_ATTRS
+    return _ITEM_FIELDS_FROM_DICT
+
+
+# Upper bound for the text surface cache (status lines and item names are open-ended)
+TEXT_CACHE_LIMIT = 256
 
 
 class GameInterface:
@@ -38,13 +99,67 @@ class GameInterface:
             'take', 'look', 'talk',
             'use', 'push', 'pull'
         ]
-        
+
+        # Per-button state (0 = idle, 1 = hovered, 2 = selected), kept in sync by the
+        # hovered_action / selected_action setters and used to index the button colors
+        self._action_colors = ACTION_BUTTON_COLORS
+        self._action_state = [0] * len(self.action_keys)
+        self._hovered_action = None
+        self._selected_action = None
+        self._hovered_index = None
+        self._selected_index = None
+
+        # Precomputed geometry (the layout is fixed for the lifetime of the interface)
+        self._build_layout()
+        self._scratch_point = pygame.Rect(0, 0, 1, 1)  # Reused 1x1 rect for point hit-tests
+
+        # Cached action bar (idle buttons), keyed by the language it was rendered in
+        self._action_bar_cache = None
+        self._action_bar_cache_language = None
+        self._action_overlay_cache: Dict[Tuple[int, int, str], pygame.Surface] = {}
+        # Composed action bar for the current (language, hovered index, selected index)
+        self._action_bar_surface: Optional[pygame.Surface] = None
+        self._action_bar_key = None
+        # Rendered verb labels for the current language: action key -> font name -> Surface
+        self._action_text_cache: Dict[str, Dict[str, pygame.Surface]] = {}
+
+        # Static inventory panel background and slot tiles keyed by (background, border, size)
+        self._inv_static_cache = self._build_inv_static_cache()
+        self._slot_tiles: Dict[Tuple[Any, ...], pygame.Surface] = {}
+        # Last composed inventory panel and the update() snapshot it was drawn from
+        self._inv_panel_cache: Optional[pygame.Surface] = None
+        self._inv_panel_key = None
+        self._arrow_surfaces = self._build_arrow_surfaces()
+
+        # Last rendered status line and its surface
+        self._status_surface_cache: Optional[Tuple[str, pygame.Surface]] = None
+
+        # Rasterized text, keyed by (text, font name, color)
+        self._text_cache: Dict[Tuple[str, str, Tuple[int, int, int]], pygame.Surface] = {}
+        
+        # Panels to redraw when the caller tracks dirty rects (context['dirty_rects'])
+        self._status_dirty = True
+        self._action_dirty = True
+        self._inv_dirty = True
+        self._status_state = None
+        self._inv_state = None
+        self._last_language = None
+
+        # Context values snapshotted by update() and read by the render methods
+        self._status = ''
+        self._inventory = []
+        self._item_fields = _ITEM_FIELDS_FROM_DICT  # Accessor chosen once per snapshot
+        self._temp_descriptions = []
+
         # UI state
-        self.show_inventory = True  # Inventaire toujours visible par défaut
+        self._show_inventory = True
+        self.show_inventory = True  # Inventaire visible par défaut (touche I pour le masquer)
         self.selected_action = None
         self.hovered_action = None
-        self.hovered_inventory_item = None  # Objet survolé dans l'inventaire
-        self.selected_inventory_item = None  # Objet sélectionné dans l'inventaire
+        self.hovered_inventory_index = None  # Index (dans l'inventaire) de l'objet survolé
+        self.selected_inventory_index = None  # Index (dans l'inventaire) de l'objet sélectionné
+        self._inventory_source = []  # Dernière liste d'inventaire vue (pour les noms ci-dessus)
+        self.hovered_lang_button = False
         
         # Inventory scrolling state
         self.inventory_scroll_offset = 0  # Index du premier objet affiché
@@ -59,24 +174,141 @@ class GameInterface:
         
         # Sprites cache pour les objets (pour les futurs PNG)
         self.item_sprites = self._load_item_sprites()
+        self._key_icon_surface = self._build_key_icon_surface()
+        # Type d'icône résolu par (id, nom) d'objet
+        self._icon_kind_cache: Dict[Tuple[str, str], Tuple[str, Optional[str], Optional[str]]] = {}
+
+    @property
+    def hovered_action(self):
+        """Action key under the mouse, or None"""
+        return self._hovered_action
+
+    @hovered_action.setter
+    def hovered_action(self, action_key) -> None:
+        if action_key != self._hovered_action:
+            self._action_dirty = True
+        self._hovered_action = action_key
+        self._hovered_index = self.action_keys.index(action_key) if action_key in self.action_keys else None
+        self._update_action_state()
+
+    @property
+    def selected_action(self):
+        """Currently selected action key, or None"""
+        return self._selected_action
+
+    @selected_action.setter
+    def selected_action(self, action_key) -> None:
+        if action_key != self._selected_action:
+            self._action_dirty = True
+        self._selected_action = action_key
+        self._selected_index = self.action_keys.index(action_key) if action_key in self.action_keys else None
+        self._update_action_state()
+
+    @property
+    def show_inventory(self) -> bool:
+        """Whether the inventory panel is shown"""
+        return self._show_inventory
+
+    @show_inventory.setter
+    def show_inventory(self, visible: bool) -> None:
+        if visible != self._show_inventory:
+            self._inv_dirty = True
+        self._show_inventory = visible
+
+    def invalidate(self) -> None:
+        """Mark every panel for redraw (e.g. after something was drawn over the interface)"""
+        self._status_dirty = True
+        self._action_dirty = True
+        self._inv_dirty = True
+
+    @property
+    def hovered_inventory_item(self) -> Optional[str]:
+        """Nom de l'objet survolé dans l'inventaire (compatibilité)"""
+        return self._inventory_item_name(self.hovered_inventory_index)
+
+    @property
+    def selected_inventory_item(self) -> Optional[str]:
+        """Nom de l'objet sélectionné dans l'inventaire (compatibilité)"""
+        return self._inventory_item_name(self.selected_inventory_index)
+
+    def _inventory_item_name(self, item_index: Optional[int]) -> Optional[str]:
+        """Retrouver le nom d'un objet à partir de son index dans l'inventaire"""
+        inventory = self._inventory_source
+        if item_index is None or item_index >= len(inventory):
+            return None
+        return self._item_fields(inventory[item_index])[1]
+
+    def _update_action_state(self) -> None:
+        """Recompute the per-button state from the hovered and selected indices"""
+        state = [0] * len(self.action_keys)
+        if self._hovered_index is not None:
+            state[self._hovered_index] = 1
+        if self._selected_index is not None:
+            state[self._selected_index] = 2
+        self._action_state = state
+
+    def _build_layout(self) -> None:
+        """Compute every interface rect once (buttons, language button, inventory zones and slots)"""
+        # Action buttons: 3x3 grid filling the action area
+        self._action_button_rects = _grid_rects(self.ACTION_AREA, 3, 3, len(self.action_keys))
+
+        # Language button in the top-right corner of the status bar
+        lang_button_size = 30
+        self.lang_button_rect = pygame.Rect(
+            self.STATUS_RECT.right - lang_button_size - 5,
+            self.STATUS_RECT.top + 2,
+            lang_button_size,
+            lang_button_size - 4
+        )
+
+        # Inventory: 30px scroll column on the left, then 8 fixed cells (2 rows of 4) with
+        # 1px of margin inside each cell (1px margin above and below both zones).
+        # The geometry does not depend on the inventory contents.
+        self._scroll_area = pygame.Rect(
+            self.INV_AREA.left,
+            self.INV_AREA.top + 1,
+            30,
+            self.INV_AREA.height - 2
+        )
+        self._inv_content_area = pygame.Rect(
+            self.INV_AREA.left + 30,
+            self.INV_AREA.top + 1,
+            self.INV_AREA.width - 30,
+            self.INV_AREA.height - 2
+        )
+        # Scroll arrows (20px, 10px apart) stacked around the middle of the scroll column
+        arrow_size = 20
+        spacing = 10
+        scroll_area = self._scroll_area
+        self._up_arrow_rect = pygame.Rect(
+            scroll_area.centerx - arrow_size // 2,
+            scroll_area.centery - arrow_size - spacing // 2,
+            arrow_size, arrow_size
+        )
+        self._down_arrow_rect = pygame.Rect(
+            scroll_area.centerx - arrow_size // 2,
+            scroll_area.centery + spacing // 2,
+            arrow_size, arrow_size
+        )
+        self._inventory_slot_rects = _grid_rects(self._inv_content_area, 4, 2, 8)
+        self._inventory_item_rects = [slot_rect.inflate(-2, -2) for slot_rect in self._inventory_slot_rects]
 
     def _load_fonts(self) -> Dict[str, pygame.font.Font]:
-        """Load UI fonts"""
-        fonts = {}
-        try:
-            fonts['small'] = pygame.font.SysFont('Arial', 16)
-            fonts['small_bold'] = pygame.font.SysFont('Arial', 16, bold=True)
-            fonts['medium'] = pygame.font.SysFont('Arial', 20)
-            fonts['large'] = pygame.font.SysFont('Arial', 24)
-        except:
-            pygame.font.init()
-            fonts['small'] = pygame.font.Font(None, 16)
-            fonts['medium'] = pygame.font.Font(None, 20)
-            fonts['large'] = pygame.font.Font(None, 24)
-        return fonts
+        """Load UI fonts (shared between interface instances)"""
+        return {
+            'small': get_font('Arial', 16),
+            'small_bold': get_font('Arial', 16, bold=True),
+            'medium': get_font('Arial', 20),
+            'large': get_font('Arial', 24),
+        }
 
     def _load_item_sprites(self) -> Dict[str, Any]:
-        """Charger les sprites des objets (PNG)"""
+        """Charger les sprites des objets (PNG)
+
+        Les sprites sont convertis au format de l'écran (convert_alpha) pour des blits rapides,
+        ce qui suppose que pygame.display.set_mode() a déjà été appelé. Sinon la conversion
+        est reportée au premier affichage d'un sprite.
+        """
         import os
         sprites = {}
         assets_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets')
@@ -88,327 +320,490 @@ class GameInterface:
             'table': 'table.png'
         }
         
+        logger = get_logger()
+        self._sprite_offsets = {}  # Position du sprite centré dans sa case
+        slot_size = self._inventory_item_rects[0].size
+        display_ready = pygame.display.get_surface() is not None
+        self._item_sprites_converted = display_ready
         for sprite_key, filename in sprite_files.items():
             sprite_path = os.path.join(assets_dir, filename)
             if os.path.exists(sprite_path):
                 try:
-                    sprites[sprite_key] = pygame.image.load(sprite_path)
-                    print(f"Sprite chargé: {filename}")
-                except:
-                    print(f"Erreur lors du chargement de {filename}")
+                    sprite = pygame.image.load(sprite_path)
+                except (pygame.error, OSError) as e:
+                    logger.warning("Erreur lors du chargement de %s: %s", filename, e)
+                    continue
+
+                # smoothscale n'accepte que des surfaces 24/32 bits : passer en 32 bits avec
+                # alpha (format de l'écran s'il existe déjà), puis mettre le sprite à la
+                # taille d'une case une fois pour toutes
+                if display_ready:
+                    sprite = sprite.convert_alpha()
+                else:
+                    sprite_32 = pygame.Surface(sprite.get_size(), pygame.SRCALPHA)
+                    sprite_32.blit(sprite, (0, 0))
+                    sprite = sprite_32
+                sprites[sprite_key], self._sprite_offsets[sprite_key] = self._fit_sprite(sprite, slot_size)
+                logger.debug("Sprite chargé: %s", filename)
             else:
-                print(f"Sprite non trouvé: {filename} (utilisation de l'icône par défaut)")
+                logger.debug("Sprite non trouvé: %s (utilisation de l'icône par défaut)", filename)
         
         return sprites
 
+    @staticmethod
+    def _fit_sprite(sprite: pygame.Surface, size: Tuple[int, int]) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Réduire ou agrandir un sprite pour qu'il tienne dans la case sans le déformer
+
+        Retourne le sprite redimensionné et son décalage pour être centré dans la case.
+        """
+        width, height = sprite.get_size()
+        scale = min(size[0] / width, size[1] / height)
+        fitted_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        fitted = pygame.transform.smoothscale(sprite, fitted_size)
+        return fitted, ((size[0] - fitted_size[0]) // 2, (size[1] - fitted_size[1]) // 2)
+
     def update(self, context: Dict[str, Any]) -> None:
-        """Update interface state"""
-        # Update based on context
-        pass
+        """Update interface state
+
+        Snapshot the context values used by the render methods and detect which panels
+        changed since the last frame.
+        """
+        language = self.loc.current_language
+        if language != self._last_language:
+            # Every label is localized
+            self._last_language = language
+            self.invalidate()
+
+        self._status = context.get('status', '')
+        self._inventory = context.get('inventory', [])
+        self._inventory_source = self._inventory
+        self._item_fields = _item_fields_getter(self._inventory)
+        self._temp_descriptions = context.get('temp_descriptions', [])
+
+        status_state = (self._status, self.hovered_lang_button)
+        if status_state != self._status_state:
+            self._status_state = status_state
+            self._status_dirty = True
+
+        inventory = self._inventory
+        if len(inventory) <= self.max_visible_items:
+            # Tout tient dans les cases : plus de défilement possible
+            self.inventory_scroll_offset = 0
+        start_index = self.inventory_scroll_offset
+        inv_state = (
+            len(inventory), start_index,
+            self.hovered_inventory_index, self.selected_inventory_index,
+            tuple(map(self._item_fields, islice(inventory, start_index, start_index + self.max_visible_items)))
+        )
+        if inv_state != self._inv_state:
+            self._inv_state = inv_state
+            self._inv_dirty = True
 
     def render(self, renderer, context: Dict[str, Any]) -> None:
-        """Render the interface"""
+        """Render the interface
+
+        When context['dirty_rects'] is a list, only the panels whose state changed are
+        redrawn and their rects are appended to it; otherwise every panel is redrawn.
+        """
+        dirty_rects = context.get('dirty_rects')
+        full_redraw = dirty_rects is None
+
         # Render status bar
-        self._render_status_bar(renderer, context)
+        if full_redraw or self._status_dirty:
+            self._render_status_bar(renderer, context)
+            if not full_redraw:
+                dirty_rects.append(self.STATUS_RECT)
 
         # Render action bar
-        self._render_action_bar(renderer, context)
+        if full_redraw or self._action_dirty:
+            self._render_action_bar(renderer, context)
+            if not full_redraw:
+                dirty_rects.append(self.ACTION_AREA)
 
-        # Render inventory (toujours visible)
-        self._render_inventory(renderer, context)
+        # Render inventory (visible par défaut, panneau vide si masqué)
+        if full_redraw or self._inv_dirty:
+            self._render_inventory(renderer, context)
+            if not full_redraw:
+                dirty_rects.append(self.INV_AREA)
 
-        # Render temporary descriptions
-        temp_descriptions = context.get('temp_descriptions', [])
-        renderer.render_temp_descriptions(temp_descriptions)
+        self._status_dirty = self._action_dirty = self._inv_dirty = False
+
+        # Render temporary descriptions (usually none)
+        if self._temp_descriptions:
+            renderer.render_temp_descriptions(self._temp_descriptions)
 
     def _render_status_bar(self, renderer, context: Dict[str, Any]) -> None:
         """Render the status bar"""
         # Background
-        renderer.fill_rect(self.STATUS_RECT, (20, 20, 20))
+        renderer.fill_rect(self.STATUS_RECT, STATUS_BG)
 
         # Status text - centered horizontally and vertically
-        status_text = context.get('status', '')
+        status_text = self._status
         if status_text:
-            renderer.render_text(status_text, self.STATUS_RECT.center,
-                               font_name='small', center=True)
+            # Dedicated single-entry cache: status lines are open-ended and would otherwise
+            # churn the shared text cache
+            cached = self._status_surface_cache
+            if cached is None or cached[0] != status_text:
+                font = renderer.fonts['small']
+                cached = (status_text, font.render(status_text, True, WHITE))
+                self._status_surface_cache = cached
+            status_surface = cached[1]
+            renderer.surface.blit(status_surface, status_surface.get_rect(center=self.STATUS_RECT.center))
         
         # Language button in top-right corner
-        lang_button_size = 30
-        self.lang_button_rect = pygame.Rect(
-            self.STATUS_RECT.right - lang_button_size - 5,
-            self.STATUS_RECT.top + 2,
-            lang_button_size,
-            lang_button_size - 4
-        )
-        
         # Button background
-        lang_color = (80, 80, 120) if getattr(self, 'hovered_lang_button', False) else (60, 60, 100)
+        lang_color = LANG_BUTTON_HOVER_BG if self.hovered_lang_button else LANG_BUTTON_BG
         renderer.fill_rect(self.lang_button_rect, lang_color)
         
         # Current language text
         current_lang = self.loc.current_language.upper()
-        renderer.render_text(current_lang, self.lang_button_rect.center,
-                           font_name='small', center=True, color=(255, 255, 255))
+        self._render_text(renderer, current_lang, self.lang_button_rect.center,
+                          font_name='small', color=WHITE)
 
     def _render_action_bar(self, renderer, context: Dict[str, Any]) -> None:
-        """Render the action buttons"""
-        # Background
-        renderer.fill_rect(self.ACTION_AREA, (40, 40, 40))
+        """Render the action buttons (one blit while language, hover and selection are unchanged)"""
+        language = self.loc.current_language
+        key = (language, self._hovered_index, self._selected_index)
+        if key != self._action_bar_key:
+            # Static part (background + idle buttons), rebuilt only when the language changes
+            if self._action_bar_cache is None or self._action_bar_cache_language != language:
+                self._rebuild_action_bar_cache(renderer)
+                self._action_bar_cache_language = language
+
+            # Compose the hovered / selected buttons over a copy of the idle bar
+            composed = self._action_bar_cache.copy()
+            offset_x, offset_y = -self.ACTION_AREA.left, -self.ACTION_AREA.top
+            overlays = []
+            for i in (self._hovered_index, self._selected_index):
+                if i is not None:
+                    overlays.append((self._get_action_overlay(renderer, i),
+                                     self._action_button_rects[i].move(offset_x, offset_y).topleft))
+            if overlays:
+                composed.blits(overlays, doreturn=False)
+            self._action_bar_surface = composed
+            self._action_bar_key = key
+
+        renderer.surface.blit(self._action_bar_surface, self.ACTION_AREA.topleft)
+
+    def _get_action_overlay(self, renderer, index: int) -> pygame.Surface:
+        """Return the pre-rendered surface of a button in its current hovered/selected state"""
+        state = self._action_state[index]
+        font_name = 'small_bold' if index == self._hovered_index else 'small'
+        key = (index, state, font_name)
+        overlay = self._action_overlay_cache.get(key)
+        if overlay is None:
+            button_rect = self._action_button_rects[index]
+            overlay = pygame.Surface(button_rect.size)
+            self._draw_action_button(overlay, overlay.get_rect(),
+                                     self._action_text_cache[self.action_keys[index]][font_name],
+                                     self._action_colors[state])
+            self._action_overlay_cache[key] = overlay
+        return overlay
+
+    def _rebuild_action_bar_cache(self, renderer) -> None:
+        """Pre-render the verb labels and the action bar with every button in its idle state"""
+        # Localized labels in both weights (bold is used while hovered)
+        fonts = renderer.fonts
+        regular_font = fonts['small']
+        bold_font = fonts.get('small_bold', regular_font)
+        self._action_text_cache = {}
+        for action_key in self.action_keys:
+            action_name = self.loc.get_action_name(action_key)
+            self._action_text_cache[action_key] = {
+                'small': regular_font.render(action_name, True, WHITE),
+                'small_bold': bold_font.render(action_name, True, WHITE),
+            }
+
+        cache = pygame.Surface(self.ACTION_AREA.size)
+        cache.fill(ACTION_AREA_BG)
+        offset_x, offset_y = -self.ACTION_AREA.left, -self.ACTION_AREA.top
+        for action_key, button_rect in zip(self.action_keys, self._action_button_rects):
+            self._draw_action_button(cache, button_rect.move(offset_x, offset_y),
+                                     self._action_text_cache[action_key]['small'], self._action_colors[0])
+        self._action_bar_cache = cache
+        # The hovered / selected overlays carry the same localized labels
+        self._action_overlay_cache.clear()
+
+    def _draw_action_button(self, surface: pygame.Surface, button_rect: pygame.Rect,
+                            text_surface: pygame.Surface, color: Tuple[int, int, int]) -> None:
+        """Draw one action button (background, border and centered label) on a surface"""
+        pygame.draw.rect(surface, color, button_rect)
+        pygame.draw.rect(surface, WHITE, button_rect, 1)
+        surface.blit(text_surface, text_surface.get_rect(center=button_rect.center))
+
+    def _get_text_surface(self, fonts: Dict[str, pygame.font.Font], text: str, font_name: str,
+                          color: Tuple[int, int, int]) -> pygame.Surface:
+        """Return the rasterized text, rendering it only the first time it is requested"""
+        key = (text, font_name, color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_LIMIT:
+                self._text_cache.clear()
+            font = fonts.get(font_name, fonts['small'])
+            text_surface = font.render(text, True, color)
+            self._text_cache[key] = text_surface
+        return text_surface
+
+    def _render_text(self, renderer, text: str, center: Tuple[int, int], font_name: str = 'small',
+                     color: Tuple[int, int, int] = WHITE) -> None:
+        """Blit cached text centered on a position"""
+        text_surface = self._get_text_surface(renderer.fonts, text, font_name, color)
+        renderer.surface.blit(text_surface, text_surface.get_rect(center=center))
+
+    def _render_inventory(self, renderer, context: Dict[str, Any]) -> None:
+        """Render the inventory panel, reusing the last composed panel while its state is unchanged"""
+        # Nothing to draw outside the current clip area
+        if not self.INV_AREA.colliderect(renderer.surface.get_clip()):
+            return
 
-        # Action buttons (3x3 grid)
-        button_width = self.ACTION_AREA.width // 3
-        button_height = self.ACTION_AREA.height // 3
+        # Inventaire masqué (touche I) : seulement le fond vide du panneau
+        if not self.show_inventory:
+            renderer.surface.blit(self._inv_static_cache, self.INV_AREA.topleft)
+            return
 
-        for i, action_key in enumerate(self.action_keys):
-            row = i // 3
-            col = i % 3
-            
-            # Get localized action name
-            action_name = self.loc.get_action_name(action_key)
+        if self._inv_panel_cache is not None and self._inv_panel_key == self._inv_state:
+            renderer.surface.blit(self._inv_panel_cache, self.INV_AREA.topleft)
+            return
 
-            button_rect = pygame.Rect(
-                self.ACTION_AREA.left + col * button_width,
-                self.ACTION_AREA.top + row * button_height,
-                button_width,
-                button_height
-            )
-
-            # Button background
-            color = (60, 60, 60)
-            if self.hovered_action == action_key:
-                color = (80, 80, 80)
-            if self.selected_action == action_key:
-                color = (100, 100, 100)
-
-            renderer.fill_rect(button_rect, color)
-            renderer.draw_rect(button_rect, (255, 255, 255), 1)
-
-            # Button text
-            text_color = (255, 255, 255)
-            font_name = 'small_bold' if self.hovered_action == action_key else 'small'
-            renderer.render_text(action_name, button_rect.center,
-                               color=text_color, font_name=font_name, center=True)
+        self._draw_inventory(renderer)
 
-    def _render_inventory(self, renderer, context: Dict[str, Any]) -> None:
-        """Render the inventory panel"""
-        # Background
-        renderer.fill_rect(self.INV_AREA, (50, 50, 50))
-        renderer.draw_rect(self.INV_AREA, (255, 255, 255), 1)
+        # Keep a copy of the composed panel (everything above is drawn inside INV_AREA)
+        if self._inv_panel_cache is None:
+            self._inv_panel_cache = pygame.Surface(self.INV_AREA.size)
+        self._inv_panel_cache.blit(renderer.surface, (0, 0), self.INV_AREA)
+        self._inv_panel_key = self._inv_state
 
-        # Get inventory items
-        inventory = context.get('inventory', [])
+    def _draw_inventory(self, renderer) -> None:
+        """Draw the inventory panel (background, scroll arrows, slots and icons)"""
+        # Background (static, pre-rendered)
+        renderer.surface.blit(self._inv_static_cache, self.INV_AREA.topleft)
+
+        if len(self._inventory) <= self.max_visible_items:
+            self._draw_inventory_simple(renderer)
+        else:
+            self._draw_inventory_scrollable(renderer)
+
+    def _draw_inventory_simple(self, renderer) -> None:
+        """Draw the slots when every item fits (no scroll arrows, no offset)"""
+        inventory = self._inventory
+        item_fields = self._item_fields
+        item_rects = self._inventory_item_rects
+
+        # Cases avec un objet, puis cases vides
+        tiles = []
+        icons = []
+        for item_index, (item, item_rect) in enumerate(zip(inventory, item_rects)):
+            item_id, item_name = item_fields(item)
+            tiles.append((self._get_item_slot_tile(item_index, item_rect.size), item_rect.topleft))
+            icons.append((item_id, item_name, item_rect))
+        for item_rect in item_rects[len(inventory):]:
+            tiles.append((self._get_slot_tile(SLOT_EMPTY_BG, SLOT_EMPTY_BORDER, item_rect.size), item_rect.topleft))
+
+        self._draw_slots(renderer, tiles, icons)
+
+    def _draw_inventory_scrollable(self, renderer) -> None:
+        """Draw the scroll arrows and the 8 visible slots from the scroll offset"""
+        inventory = self._inventory
         total_items = len(inventory)
-        
-        # Zone de flèches à gauche de l'inventaire (30px comme spécifié)
-        scroll_area = pygame.Rect(
-            self.INV_AREA.left,
-            self.INV_AREA.top + 1,  # 1px de marge en haut
-            30,
-            self.INV_AREA.height - 2  # 1px de marge en haut et en bas
-        )
-        
-        # Zone d'inventaire ajustée (sans les 30px des flèches + marges haut/bas)
-        inv_content_area = pygame.Rect(
-            self.INV_AREA.left + 30,
-            self.INV_AREA.top + 1,  # 1px de marge en haut
-            self.INV_AREA.width - 30,
-            self.INV_AREA.height - 2  # 1px de marge en haut et en bas
-        )
 
-        # Dessiner les flèches de défilement si nécessaire
-        if total_items > self.max_visible_items:
-            self._render_scroll_arrows(renderer, scroll_area, total_items)
+        # Dessiner les flèches de défilement
+        self._render_scroll_arrows(renderer, total_items)
 
-        # Afficher les 8 cases d'inventaire utilisant tout l'espace disponible
-        slots_per_row = 4  # 4 cases par rangée
-        rows = 2  # 2 rangées
-        
-        # Diviser l'espace en 8 parties égales
-        slot_width = inv_content_area.width // slots_per_row
-        slot_height = inv_content_area.height // rows
-        
         # Afficher les 8 cases visibles avec défilement
-        for i in range(self.max_visible_items):
-            row = i // slots_per_row
-            col = i % slots_per_row
-            
-            slot_rect = pygame.Rect(
-                inv_content_area.left + col * slot_width,
-                inv_content_area.top + row * slot_height,
-                slot_width,
-                slot_height
-            )
-            
-            # Rectangle pour l'objet avec 1px de marge
-            item_rect = pygame.Rect(
-                slot_rect.left + 1,
-                slot_rect.top + 1,
-                slot_rect.width - 2,
-                slot_rect.height - 2
-            )
-
+        tiles = []
+        icons = []
+        for i, item_rect in enumerate(self._inventory_item_rects):
             # Index de l'objet réel avec le défilement
             item_index = self.inventory_scroll_offset + i
-            
+
             if item_index < total_items:
                 # Case avec un objet
-                item = inventory[item_index]
-                item_name = item.get('name', '')
-                
-                # Vérifier si l'objet est survolé ou sélectionné
-                is_hovered = (self.hovered_inventory_item == item_name)
-                is_selected = (self.selected_inventory_item == item_name)
-                
-                # Couleur de fond selon l'état
-                if is_selected:
-                    bg_color = (100, 100, 100)  # Plus clair si sélectionné
-                    border_color = (255, 255, 255)  # Bordure blanche
-                elif is_hovered:
-                    bg_color = (85, 85, 85)  # Légèrement plus clair si survolé
-                    border_color = (255, 255, 255)  # Bordure blanche
-                else:
-                    bg_color = (70, 70, 70)  # Couleur normale
-                    border_color = None  # Pas de bordure
-                
-                # Dessiner le fond
-                renderer.fill_rect(item_rect, bg_color)
-                
-                # Dessiner la bordure si nécessaire
-                if border_color:
-                    renderer.draw_rect(item_rect, border_color, 1)
-                
-                # Afficher l'icône/image de l'objet
-                self._render_item_icon(renderer, item, item_rect)
+                item_id, item_name = self._item_fields(inventory[item_index])
+                tiles.append((self._get_item_slot_tile(item_index, item_rect.size), item_rect.topleft))
+                icons.append((item_id, item_name, item_rect))
             else:
                 # Case vide
-                renderer.fill_rect(item_rect, (30, 30, 30))
-                renderer.draw_rect(item_rect, (100, 100, 100), 1)
-
-    def _render_scroll_arrows(self, renderer, scroll_area: pygame.Rect, total_items: int) -> None:
+                tiles.append((self._get_slot_tile(SLOT_EMPTY_BG, SLOT_EMPTY_BORDER, item_rect.size), item_rect.topleft))
+
+        self._draw_slots(renderer, tiles, icons)
+
+    def _draw_slots(self, renderer, tiles: List[Tuple[pygame.Surface, Tuple[int, int]]],
+                    icons: List[Tuple[Any, str, pygame.Rect]]) -> None:
+        """Blit the slot tiles in one call, then the item icons on top"""
+        # Dessiner les fonds et bordures des cases
+        renderer.blit_surfaces(tiles)
+
+        # Afficher l'icône/image des objets
+        for item_id, item_name, item_rect in icons:
+            self._render_item_icon(renderer, item_id, item_name, item_rect)
+
+    def _get_item_slot_tile(self, item_index: int, size: Tuple[int, int]) -> pygame.Surface:
+        """Return the slot tile of an occupied slot according to its hover/selection state"""
+        # Couleur de fond selon l'état
+        if self.selected_inventory_index == item_index:
+            # Plus clair si sélectionné, bordure blanche
+            return self._get_slot_tile(SLOT_SELECTED_BG, WHITE, size)
+        if self.hovered_inventory_index == item_index:
+            # Légèrement plus clair si survolé, bordure blanche
+            return self._get_slot_tile(SLOT_HOVER_BG, WHITE, size)
+        # Couleur normale, pas de bordure
+        return self._get_slot_tile(SLOT_BG, None, size)
+
+    def _get_slot_tile(self, bg_color: Tuple[int, int, int], border_color: Optional[Tuple[int, int, int]],
+                       size: Tuple[int, int]) -> pygame.Surface:
+        """Return a pre-rendered inventory slot (background plus optional 1px border)"""
+        key = (bg_color, border_color, size)
+        tile = self._slot_tiles.get(key)
+        if tile is None:
+            tile = pygame.Surface(size)
+            tile.fill(bg_color)
+            if border_color:
+                pygame.draw.rect(tile, border_color, tile.get_rect(), 1)
+            self._slot_tiles[key] = tile
+        return tile
+
+    def _build_inv_static_cache(self) -> pygame.Surface:
+        """Pre-render the inventory panel background and its border"""
+        surface = pygame.Surface(self.INV_AREA.size)
+        surface.fill(INVENTORY_BG)
+        pygame.draw.rect(surface, WHITE, surface.get_rect(), 1)
+        return surface
+
+    def _render_scroll_arrows(self, renderer, total_items: int) -> None:
         """Dessiner les flèches de défilement à gauche de l'inventaire"""
-        # Background pour la zone de défilement
-        renderer.fill_rect(scroll_area, (40, 40, 40))
-        renderer.draw_rect(scroll_area, (255, 255, 255), 1)
-        
-        # Dimensions des flèches (verticalement empilées)
-        arrow_size = 20
-        spacing = 10
-        
-        # Position verticale centrée
-        center_y = scroll_area.centery
-        
-        # Flèche vers le haut (scroll vers les objets précédents)
-        up_arrow_rect = pygame.Rect(
-            scroll_area.centerx - arrow_size // 2, 
-            center_y - arrow_size - spacing // 2,
-            arrow_size, arrow_size
-        )
-        
-        # Flèche vers le bas (scroll vers les objets suivants)
-        down_arrow_rect = pygame.Rect(
-            scroll_area.centerx - arrow_size // 2, 
-            center_y + spacing // 2,
-            arrow_size, arrow_size
-        )
-        
-        # Couleurs des flèches selon la possibilité de scroll
+        scroll_area = self._scroll_area
+
+        # Possibilité de scroll dans chaque sens
         can_scroll_up = self.inventory_scroll_offset > 0
         can_scroll_down = self.inventory_scroll_offset + self.max_visible_items < total_items
         
-        # Dessiner flèche vers le haut
-        up_color = (255, 255, 255) if can_scroll_up else (100, 100, 100)
-        renderer.fill_rect(up_arrow_rect, (60, 60, 60))
-        renderer.draw_rect(up_arrow_rect, up_color, 2)
-        
-        # Dessiner triangle pointant vers le haut
-        triangle_points = [
-            (up_arrow_rect.centerx, up_arrow_rect.top + 4),  # Sommet
-            (up_arrow_rect.left + 4, up_arrow_rect.bottom - 4),  # Base gauche
-            (up_arrow_rect.right - 4, up_arrow_rect.bottom - 4)  # Base droite
-        ]
-        pygame.draw.polygon(renderer.surface, up_color, triangle_points)
-        
-        # Dessiner flèche vers le bas
-        down_color = (255, 255, 255) if can_scroll_down else (100, 100, 100)
-        renderer.fill_rect(down_arrow_rect, (60, 60, 60))
-        renderer.draw_rect(down_arrow_rect, down_color, 2)
-        
-        # Dessiner triangle pointant vers le bas
-        triangle_points = [
-            (down_arrow_rect.centerx, down_arrow_rect.bottom - 4),  # Sommet
-            (down_arrow_rect.left + 4, down_arrow_rect.top + 4),  # Base gauche
-            (down_arrow_rect.right - 4, down_arrow_rect.top + 4)  # Base droite
-        ]
-        pygame.draw.polygon(renderer.surface, down_color, triangle_points)
-
-    def _render_item_icon(self, renderer, item: Dict[str, Any], slot_rect: pygame.Rect) -> None:
+        # Fond de la zone de défilement
+        renderer.fill_rect(scroll_area, SCROLL_AREA_BG)
+        renderer.draw_rect(scroll_area, WHITE, 1)
+
+        # Flèches pré-rendues (fond, bordure et triangle) selon la possibilité de scroll
+        renderer.blit_surfaces([
+            (self._arrow_surfaces[('up', can_scroll_up)], self._up_arrow_rect.topleft),
+            (self._arrow_surfaces[('down', can_scroll_down)], self._down_arrow_rect.topleft),
+        ])
+
+    def _build_arrow_surfaces(self, arrow_size: int = 20) -> Dict[Tuple[str, bool], pygame.Surface]:
+        """Pré-rendre les boutons de défilement (haut/bas, actif/inactif)"""
+        surfaces = {}
+        for direction in ('up', 'down'):
+            for enabled in (True, False):
+                color = WHITE if enabled else ARROW_DISABLED
+                surface = pygame.Surface((arrow_size, arrow_size))
+                arrow_rect = surface.get_rect()
+                surface.fill(ARROW_BG)
+                pygame.draw.rect(surface, color, arrow_rect, 2)
+
+                if direction == 'up':
+                    # Triangle pointant vers le haut
+                    triangle_points = [
+                        (arrow_rect.centerx, arrow_rect.top + 4),  # Sommet
+                        (arrow_rect.left + 4, arrow_rect.bottom - 4),  # Base gauche
+                        (arrow_rect.right - 4, arrow_rect.bottom - 4)  # Base droite
+                    ]
+                else:
+                    # Triangle pointant vers le bas
+                    triangle_points = [
+                        (arrow_rect.centerx, arrow_rect.bottom - 4),  # Sommet
+                        (arrow_rect.left + 4, arrow_rect.top + 4),  # Base gauche
+                        (arrow_rect.right - 4, arrow_rect.top + 4)  # Base droite
+                    ]
+                pygame.draw.polygon(surface, color, triangle_points)
+                surfaces[(direction, enabled)] = surface
+        return surfaces
+
+    def _render_item_icon(self, renderer, item_id: str, item_name: str, slot_rect: pygame.Rect) -> None:
         """Rendre l'icône d'un objet dans l'inventaire"""
-        item_id = item.get('id', '')
-        item_name = item.get('name', '')
-        
-        # Essayer d'abord de charger un sprite PNG si disponible
-        sprite_key = self._get_sprite_key(item_id, item_name)
-        if sprite_key in self.item_sprites:
-            # Afficher le sprite PNG
-            sprite = self.item_sprites[sprite_key]
-            # Redimensionner et centrer le sprite dans la case
-            sprite_rect = sprite.get_rect(center=slot_rect.center)
-            renderer.screen.blit(sprite, sprite_rect)
-            return
-        
-        # Sinon, utiliser les icônes par défaut
-        if 'clé' in item_name.lower() or 'key' in item_id.lower():
+        kind, value, font_name = self._get_icon_kind(item_id, item_name)
+        if kind == 'sprite':
+            if not self._item_sprites_converted:
+                self._convert_item_sprites()
+            # Afficher le sprite PNG (déjà redimensionné), centré dans la case
+            offset_x, offset_y = self._sprite_offsets[value]
+            renderer.surface.blit(self.item_sprites[value], (slot_rect.x + offset_x, slot_rect.y + offset_y))
+        elif kind == 'key':
             # Icône de clé - dessiner une clé
             self._draw_key_icon(renderer, slot_rect)
-        elif 'porte' in item_name.lower() or 'door' in item_id.lower():
-            # Icône de porte
-            renderer.render_text("🚪", slot_rect.center, font_name='medium', center=True, color=(255, 255, 255))
-        elif 'table' in item_name.lower():
-            # Icône de table  
-            renderer.render_text("🪑", slot_rect.center, font_name='medium', center=True, color=(255, 255, 255))
         else:
-            # Objet générique - afficher la première lettre du nom
-            first_letter = item_name[0].upper() if item_name else "?"
-            renderer.render_text(first_letter, slot_rect.center, font_name='large', center=True, color=(255, 255, 255))
+            # Émoji (porte, table) ou première lettre du nom
+            self._render_text(renderer, value, slot_rect.center, font_name=font_name, color=WHITE)
+
+    def _convert_item_sprites(self) -> None:
+        """Convertir les sprites chargés avant la création de la fenêtre"""
+        for sprite_key, sprite in self.item_sprites.items():
+            self.item_sprites[sprite_key] = sprite.convert_alpha()
+        self._item_sprites_converted = True
+
+    def _get_icon_kind(self, item_id: str, item_name: str) -> Tuple[str, Optional[str], Optional[str]]:
+        """Déterminer une fois par objet comment dessiner son icône: (type, valeur, police)"""
+        cache_key = (item_id, item_name)
+        icon = self._icon_kind_cache.get(cache_key)
+        if icon is None:
+            # Essayer d'abord un sprite PNG si disponible, sinon les icônes par défaut
+            sprite_key = self._get_sprite_key(item_id, item_name)
+            if sprite_key in self.item_sprites:
+                icon = ('sprite', sprite_key, None)
+            elif sprite_key == 'cle':
+                icon = ('key', None, None)
+            elif sprite_key == 'porte':
+                icon = ('text', "🚪", 'medium')
+            elif sprite_key == 'table':
+                icon = ('text', "🪑", 'medium')
+            else:
+                # Objet générique - afficher la première lettre du nom
+                first_letter = item_name[0].upper() if item_name else "?"
+                icon = ('text', first_letter, 'large')
+            self._icon_kind_cache[cache_key] = icon
+        return icon
 
     def _get_sprite_key(self, item_id: str, item_name: str) -> str:
         """Obtenir la clé du sprite selon l'objet"""
-        if 'clé' in item_name.lower() or 'key' in item_id.lower():
+        name = item_name.lower()
+        if 'clé' in name or 'key' in item_id.lower():
             return 'cle'
-        elif 'porte' in item_name.lower() or 'door' in item_id.lower():
+        elif 'porte' in name or 'door' in item_id.lower():
             return 'porte'
-        elif 'table' in item_name.lower():
+        elif 'table' in name:
             return 'table'
         else:
             return 'default'
     
     def _draw_key_icon(self, renderer, slot_rect: pygame.Rect) -> None:
-        """Dessiner une icône de clé simple"""
+        """Dessiner une icône de clé simple (surface pré-rendue centrée dans la case)"""
         # TODO: Plus tard, charger cle.png depuis les assets
-        # Pour l'instant, dessiner une clé simple avec des rectangles
-        
-        center_x = slot_rect.centerx
-        center_y = slot_rect.centery
-        
+        offset_x, offset_y = KEY_ICON_ORIGIN
+        renderer.surface.blit(self._key_icon_surface, (slot_rect.centerx + offset_x, slot_rect.centery + offset_y))
+
+    def _build_key_icon_surface(self) -> pygame.Surface:
+        """Dessiner une fois la clé simple avec des rectangles, sur fond transparent"""
+        surface = pygame.Surface(KEY_ICON_SIZE, pygame.SRCALPHA)
+        # Coordonnées relatives au centre de la case, ramenées dans la surface
+        center_x, center_y = -KEY_ICON_ORIGIN[0], -KEY_ICON_ORIGIN[1]
+
         # Corps de la clé (tige)
         key_body = pygame.Rect(center_x - 15, center_y - 2, 20, 4)
-        renderer.fill_rect(key_body, (255, 215, 0))  # Couleur dorée
-        
+        pygame.draw.rect(surface, KEY_GOLD, key_body)  # Couleur dorée
+
         # Tête de la clé (cercle/carré)
         key_head = pygame.Rect(center_x - 18, center_y - 6, 8, 12)
-        renderer.fill_rect(key_head, (255, 215, 0))
-        renderer.draw_rect(key_head, (200, 180, 0), 1)
-        
+        pygame.draw.rect(surface, KEY_GOLD, key_head)
+        pygame.draw.rect(surface, KEY_GOLD_BORDER, key_head, 1)
+
         # Dents de la clé
         tooth1 = pygame.Rect(center_x + 2, center_y, 3, 4)
         tooth2 = pygame.Rect(center_x + 8, center_y, 2, 3)
-        renderer.fill_rect(tooth1, (255, 215, 0))
-        renderer.fill_rect(tooth2, (255, 215, 0))
+        pygame.draw.rect(surface, KEY_GOLD, tooth1)
+        pygame.draw.rect(surface, KEY_GOLD, tooth2)
+        return surface
 
     def handle_click(self, pos: Tuple[int, int], context: Dict[str, Any]) -> bool:
         """Handle mouse click on interface"""
         # Check language button
-        if hasattr(self, 'lang_button_rect') and self.lang_button_rect.collidepoint(pos):
+        if self.lang_button_rect.collidepoint(pos):
             self._toggle_language()
             return True
             
@@ -416,7 +811,7 @@ class GameInterface:
         if self._handle_action_click(pos, context):
             return True
 
-        # Check inventory (toujours interactif)
+        # Check inventory (ignoré quand il est masqué)
         if self._handle_inventory_click(pos, context):
             return True
 
@@ -425,210 +820,98 @@ class GameInterface:
     def handle_hover(self, pos: Tuple[int, int], context: Dict[str, Any] = None) -> None:
         """Handle mouse hover on interface elements"""
         # Reset hover state
-        self.hovered_action = None
-        self.hovered_inventory_item = None
+        self.hovered_inventory_index = None
         self.hovered_lang_button = False
         
         # Check language button
-        if hasattr(self, 'lang_button_rect') and self.lang_button_rect.collidepoint(pos):
+        if self.lang_button_rect.collidepoint(pos):
             self.hovered_lang_button = True
+            self.hovered_action = None
             return
         
-        # Check action buttons
-        button_width = self.ACTION_AREA.width // 3
-        button_height = self.ACTION_AREA.height // 3
-
-        for i, action_key in enumerate(self.action_keys):
-            row = i // 3
-            col = i % 3
-
-            button_rect = pygame.Rect(
-                self.ACTION_AREA.left + col * button_width,
-                self.ACTION_AREA.top + row * button_height,
-                button_width,
-                button_height
-            )
-
-            if button_rect.collidepoint(pos):
-                self.hovered_action = action_key
-                break
+        # Check action buttons (single assignment: the setter refreshes the button state once)
+        self._scratch_point.topleft = pos
+        index = self._scratch_point.collidelist(self._action_button_rects)
+        self.hovered_action = self.action_keys[index] if index >= 0 else None
         
         # Check inventory hover if context is provided
         if context is not None:
-            self.hovered_inventory_item = self.get_hovered_inventory_item(pos, context)
+            self.hovered_inventory_index = self._get_inventory_index_at(pos, context)
 
-    def get_hovered_inventory_item(self, pos: Tuple[int, int], context: Dict[str, Any]) -> str:
-        """Retourner le nom de l'objet survolé dans l'inventaire"""
+    def _get_inventory_index_at(self, pos: Tuple[int, int], context: Dict[str, Any]) -> Optional[int]:
+        """Retourner l'index (dans l'inventaire) de l'objet sous la position, ou None"""
+        if not self.show_inventory:
+            return None
         inventory = context.get('inventory', [])
-        
-        # Zone d'inventaire ajustée (sans les 30px des flèches + marges haut/bas)
-        inv_content_area = pygame.Rect(
-            self.INV_AREA.left + 30,
-            self.INV_AREA.top + 1,  # 1px de marge en haut
-            self.INV_AREA.width - 30,
-            self.INV_AREA.height - 2  # 1px de marge en haut et en bas
-        )
-        
-        # Utiliser les mêmes dimensions que le rendu
-        slots_per_row = 4
-        rows = 2
-        slot_width = inv_content_area.width // slots_per_row
-        slot_height = inv_content_area.height // rows
-        
-        # Calculer les objets visibles avec le décalage de scroll
-        start_index = self.inventory_scroll_offset
-        visible_inventory = inventory[start_index:start_index + self.max_visible_items]
+        self._inventory_source = inventory
 
-        for i, item in enumerate(visible_inventory):
-            row = i // slots_per_row
-            col = i % slots_per_row
-            
-            # Rectangle de la case complète
-            slot_rect = pygame.Rect(
-                inv_content_area.left + col * slot_width,
-                inv_content_area.top + row * slot_height,
-                slot_width,
-                slot_height
-            )
-            
-            # Rectangle pour l'objet avec 1px de marge
-            item_rect = pygame.Rect(
-                slot_rect.left + 1,
-                slot_rect.top + 1,
-                slot_rect.width - 2,
-                slot_rect.height - 2
-            )
+        self._scratch_point.topleft = pos
+        index = self._scratch_point.collidelist(self._inventory_item_rects)
+        if index < 0:
+            return None
 
-            if item_rect.collidepoint(pos):
-                return item['name']
+        # Index de l'objet réel avec le défilement
+        item_index = self.inventory_scroll_offset + index
+        return item_index if item_index < len(inventory) else None
 
-        return ""
+    def get_hovered_inventory_item(self, pos: Tuple[int, int], context: Dict[str, Any]) -> str:
+        """Retourner le nom de l'objet survolé dans l'inventaire"""
+        item_index = self._get_inventory_index_at(pos, context)
+        if item_index is None:
+            return ""
+        return self._inventory_item_name(item_index)
 
     def _handle_action_click(self, pos: Tuple[int, int], context: Dict[str, Any]) -> bool:
         """Handle click on action buttons"""
-        button_width = self.ACTION_AREA.width // 3
-        button_height = self.ACTION_AREA.height // 3
-
-        for i, action_key in enumerate(self.action_keys):
-            row = i // 3
-            col = i % 3
-
-            button_rect = pygame.Rect(
-                self.ACTION_AREA.left + col * button_width,
-                self.ACTION_AREA.top + row * button_height,
-                button_width,
-                button_height
-            )
-
-            if button_rect.collidepoint(pos):
-                self.selected_action = action_key
-                context['selected_action'] = action_key
-                context['status'] = self.loc.get_action_name(action_key)
-                return True
+        self._scratch_point.topleft = pos
+        index = self._scratch_point.collidelist(self._action_button_rects)
+        if index < 0:
+            return False
 
-        return False
+        action_key = self.action_keys[index]
+        self.selected_action = action_key
+        context['selected_action'] = action_key
+        context['status'] = self.loc.get_action_name(action_key)
+        return True
 
     def _handle_inventory_click(self, pos: Tuple[int, int], context: Dict[str, Any]) -> bool:
         """Handle click on inventory items and scroll arrows"""
+        if not self.show_inventory:
+            return False
+
         inventory = context.get('inventory', [])
         total_items = len(inventory)
         
-        # Zone de flèches à gauche (30px + marges haut/bas)
-        scroll_area = pygame.Rect(
-            self.INV_AREA.left,
-            self.INV_AREA.top + 1,  # 1px de marge en haut
-            30,
-            self.INV_AREA.height - 2  # 1px de marge en haut et en bas
-        )
-        
-        # Zone d'inventaire ajustée (sans les 30px des flèches + marges haut/bas)
-        inv_content_area = pygame.Rect(
-            self.INV_AREA.left + 30,
-            self.INV_AREA.top + 1,  # 1px de marge en haut
-            self.INV_AREA.width - 30,
-            self.INV_AREA.height - 2  # 1px de marge en haut et en bas
-        )
-
-        # Vérifier les clics sur les flèches de défilement
-        if total_items > self.max_visible_items and scroll_area.collidepoint(pos):
-            # Dimensions des flèches (verticalement empilées)
-            arrow_size = 20
-            spacing = 10
-            center_y = scroll_area.centery
-            
-            # Zone de la flèche vers le haut
-            up_arrow_rect = pygame.Rect(
-                scroll_area.centerx - arrow_size // 2, 
-                center_y - arrow_size - spacing // 2,
-                arrow_size, arrow_size
-            )
-            
-            # Zone de la flèche vers le bas
-            down_arrow_rect = pygame.Rect(
-                scroll_area.centerx - arrow_size // 2, 
-                center_y + spacing // 2,
-                arrow_size, arrow_size
-            )
-            
-            if up_arrow_rect.collidepoint(pos) and self.inventory_scroll_offset > 0:
+        # Vérifier les clics sur les flèches de défilement (zone de 30px à gauche)
+        if total_items > self.max_visible_items and self._scroll_area.collidepoint(pos):
+            if self._up_arrow_rect.collidepoint(pos) and self.inventory_scroll_offset > 0:
                 # Défiler vers le haut
                 self.inventory_scroll_offset = max(0, self.inventory_scroll_offset - self.max_visible_items)
                 return True
                 
-            elif down_arrow_rect.collidepoint(pos) and self.inventory_scroll_offset + self.max_visible_items < total_items:
+            elif self._down_arrow_rect.collidepoint(pos) and self.inventory_scroll_offset + self.max_visible_items < total_items:
                 # Défiler vers le bas
                 self.inventory_scroll_offset = min(total_items - self.max_visible_items, 
                                                  self.inventory_scroll_offset + self.max_visible_items)
                 return True
 
         # Vérifier les clics sur les cases d'inventaire
-        slots_per_row = 4
-        rows = 2
-        
-        # Diviser l'espace en 8 parties égales
-        slot_width = inv_content_area.width // slots_per_row
-        slot_height = inv_content_area.height // rows
+        item_index = self._get_inventory_index_at(pos, context)
+        if item_index is None:
+            return None
 
-        for i in range(self.max_visible_items):
-            row = i // slots_per_row
-            col = i % slots_per_row
-            
-            # Rectangle de la case complète
-            slot_rect = pygame.Rect(
-                inv_content_area.left + col * slot_width,
-                inv_content_area.top + row * slot_height,
-                slot_width,
-                slot_height
-            )
-            
-            # Rectangle pour l'objet avec 1px de marge
-            item_rect = pygame.Rect(
-                slot_rect.left + 1,
-                slot_rect.top + 1,
-                slot_rect.width - 2,
-                slot_rect.height - 2
-            )
-
-            if item_rect.collidepoint(pos):
-                # Index de l'objet réel avec le défilement
-                item_index = self.inventory_scroll_offset + i
-                
-                if item_index < total_items:
-                    # Objet cliqué
-                    clicked_item = inventory[item_index]
-                    item_name = clicked_item.get('name', '')
-                    
-                    # Gérer la sélection - toggle si on clique sur le même objet
-                    if self.selected_inventory_item == item_name:
-                        self.selected_inventory_item = None
-                    else:
-                        self.selected_inventory_item = item_name
-                    
-                    # Stocker l'objet cliqué pour usage externe
-                    context['selected_inventory_item'] = clicked_item
-                    return clicked_item
-
-        return None
+        # Objet cliqué
+        clicked_item = inventory[item_index]
+
+        # Gérer la sélection - toggle si on clique sur le même objet
+        if self.selected_inventory_index == item_index:
+            self.selected_inventory_index = None
+        else:
+            self.selected_inventory_index = item_index
+
+        # Stocker l'objet cliqué pour usage externe
+        context['selected_inventory_item'] = clicked_item
+        return clicked_item
 
     def get_clicked_inventory_item(self, pos: Tuple[int, int], context: Dict[str, Any]):
         """Retourner l'objet de l'inventaire cliqué (pour les actions à deux objets)"""
@@ -636,7 +919,7 @@ class GameInterface:
 
     def clear_selections(self) -> None:
         """Nettoyer tous les états de sélection après l'exécution d'une action"""
-        self.selected_inventory_item = None
+        self.selected_inventory_index = None
         self.selected_action = None
         self.first_object = None
 
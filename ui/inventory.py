@@ -2,8 +2,9 @@
 Inventory management system
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import pygame
+from utils.images import load_icon
 
 
 class InventoryItem:
@@ -16,18 +17,27 @@ class InventoryItem:
         self.description = description
         self.icon_path = icon_path
         self.quantity = quantity
-        self.icon = None
 
-        # Load icon if provided
-        if self.icon_path:
+        # Icon decoded on first access (see the icon property)
+        self._icon = None
+        self._icon_loaded = False
+
+    @property
+    def icon(self) -> Optional[pygame.Surface]:
+        """Item icon, loaded the first time it is read (None without icon_path)"""
+        if not self._icon_loaded:
             self._load_icon()
+        return self._icon
+
+    @icon.setter
+    def icon(self, surface: Optional[pygame.Surface]) -> None:
+        self._icon = surface
+        self._icon_loaded = True
 
     def _load_icon(self) -> None:
         """Load item icon"""
-        try:
-            self.icon = pygame.image.load(self.icon_path)
-        except:
-            self.icon = None
+        self._icon = load_icon(self.icon_path) if self.icon_path else None
+        self._icon_loaded = True
 
     def use(self) -> bool:
         """Use the item (returns True if item was consumed)"""
@@ -67,50 +77,59 @@ class Inventory:
 
     def __init__(self, max_slots: int = 20):
         self.max_slots = max_slots
-        self.items: List[InventoryItem] = []
+        # Items by id; dicts keep insertion order, so this is also the display order
+        self._by_id: Dict[str, InventoryItem] = {}
         self.selected_item: Optional[InventoryItem] = None
 
+    @property
+    def items(self) -> Tuple[InventoryItem, ...]:
+        """Items in the order they were added (read-only: use add_item/remove_item)"""
+        return tuple(self._by_id.values())
+
+    @items.setter
+    def items(self, items: List[InventoryItem]) -> None:
+        by_id: Dict[str, InventoryItem] = {}
+        for item in items:
+            if item.id in by_id:
+                raise ValueError(f"Duplicate inventory item id: {item.id}")
+            by_id[item.id] = item
+        self._by_id = by_id
+
     def add_item(self, item: InventoryItem) -> bool:
         """Add an item to inventory. Returns True if successful."""
         # Check if item already exists
-        for existing_item in self.items:
-            if existing_item.id == item.id:
-                existing_item.add_quantity(item.quantity)
-                return True
+        existing_item = self._by_id.get(item.id)
+        if existing_item is not None:
+            existing_item.add_quantity(item.quantity)
+            return True
 
         # Check if inventory is full
-        if len(self.items) >= self.max_slots:
+        if len(self._by_id) >= self.max_slots:
             return False
 
         # Add new item
-        self.items.append(item)
+        self._by_id[item.id] = item
         return True
 
     def remove_item(self, item_id: str, quantity: int = 1) -> bool:
         """Remove item from inventory. Returns True if successful."""
-        for item in self.items:
-            if item.id == item_id:
-                if item.quantity >= quantity:
-                    item.quantity -= quantity
-                    if item.quantity == 0:
-                        self.items.remove(item)
-                    return True
-                break
-        return False
+        item = self._by_id.get(item_id)
+        if item is None or item.quantity < quantity:
+            return False
+
+        item.quantity -= quantity
+        if item.quantity == 0:
+            del self._by_id[item_id]
+        return True
 
     def has_item(self, item_id: str, quantity: int = 1) -> bool:
         """Check if inventory contains the specified item and quantity"""
-        for item in self.items:
-            if item.id == item_id and item.quantity >= quantity:
-                return True
-        return False
+        item = self._by_id.get(item_id)
+        return item is not None and item.quantity >= quantity
 
     def get_item(self, item_id: str) -> Optional[InventoryItem]:
         """Get item by ID"""
-        for item in self.items:
-            if item.id == item_id:
-                return item
-        return None
+        return self._by_id.get(item_id)
 
     def select_item(self, item_id: str) -> bool:
         """Select an item for use. Returns True if successful."""
@@ -129,33 +148,33 @@ class Inventory:
         if self.selected_item:
             consumed = self.selected_item.use()
             if consumed:
-                self.items.remove(self.selected_item)
+                del self._by_id[self.selected_item.id]
                 self.selected_item = None
             return True
         return False
 
     def get_items_list(self) -> List[Dict[str, Any]]:
         """Get list of items for UI display"""
-        return [item.to_dict() for item in self.items]
+        return [item.to_dict() for item in self._by_id.values()]
 
     def get_total_items(self) -> int:
         """Get total number of items in inventory"""
-        return len(self.items)
+        return len(self._by_id)
 
     def is_full(self) -> bool:
         """Check if inventory is full"""
-        return len(self.items) >= self.max_slots
+        return len(self._by_id) >= self.max_slots
 
     def clear(self) -> None:
         """Clear all items from inventory"""
-        self.items.clear()
+        self._by_id.clear()
         self.selected_item = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert inventory to dictionary for serialization"""
         return {
             'max_slots': self.max_slots,
-            'items': [item.to_dict() for item in self.items],
+            'items': [item.to_dict() for item in self._by_id.values()],
             'selected_item_id': self.selected_item.id if self.selected_item else None
         }
 
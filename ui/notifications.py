@@ -3,8 +3,10 @@ Notification system for displaying temporary messages
 """
 
 import pygame
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
+from bisect import bisect_left, bisect_right
 import time
+from utils.fonts import get_font
 
 
 class Notification:
@@ -16,24 +18,38 @@ class Notification:
         self.position = position
         self.duration = duration
         self.color = color
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.alpha = 255
 
-    def is_expired(self) -> bool:
-        """Check if notification has expired"""
-        return time.time() - self.start_time > self.duration
-
-    def get_alpha(self) -> int:
-        """Get current alpha value for fade effect"""
-        elapsed = time.time() - self.start_time
-        if elapsed > self.duration - 1.0:  # Start fading 1 second before expiry
-            fade_progress = (elapsed - (self.duration - 1.0)) / 1.0
-            self.alpha = int(255 * (1 - fade_progress))
-        return max(0, self.alpha)
+        # Rendered once by NotificationSystem.render (text and color never change)
+        self._text_surface = None
+        self._bg_surface = None
+        # Blit positions, computed with the surfaces and reset when the position changes
+        self._text_pos = None
+        self._bg_pos = None
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check if notification has expired (now is a time.monotonic() timestamp)"""
+        if now is None:
+            now = time.monotonic()
+        return now - self.start_time > self.duration
+
+    def get_alpha(self, now: Optional[float] = None) -> int:
+        """Get current alpha value for fade effect (now is a time.monotonic() timestamp)"""
+        if now is None:
+            now = time.monotonic()
+        remaining = self.start_time + self.duration - now
+        if remaining >= 1.0:
+            # Fully opaque until the last second
+            return self.alpha
+        # Fade out over the last second before expiry
+        self.alpha = int(255 * remaining) if remaining > 0.0 else 0
+        return self.alpha
 
     def update_position(self, new_position: Tuple[int, int]) -> None:
         """Update notification position"""
         self.position = new_position
+        self._text_pos = None
 
 
 class NotificationSystem:
@@ -41,22 +57,27 @@ class NotificationSystem:
 
     def __init__(self):
         self.notifications: List[Notification] = []
+        # Deadlines (start_time + duration) kept sorted, with the matching notifications in
+        # a parallel list, so update() finds the expired ones with a single bisect
+        self._deadlines: List[float] = []
+        self._by_deadline: List[Notification] = []
         self.font = None
+        self._bg_cache: Dict[Tuple[int, int], pygame.Surface] = {}  # Backgrounds by size
         self._load_font()
 
     def _load_font(self) -> None:
         """Load notification font"""
-        try:
-            self.font = pygame.font.SysFont('Arial', 18, bold=True)
-        except:
-            pygame.font.init()
-            self.font = pygame.font.Font(None, 18)
+        self.font = get_font('Arial', 18, bold=True)
 
     def add_notification(self, text: str, position: Tuple[int, int],
                         duration: float = 3.0, color: Tuple[int, int, int] = (255, 255, 255)) -> None:
         """Add a new notification"""
         notification = Notification(text, position, duration, color)
         self.notifications.append(notification)
+        deadline = notification.start_time + duration
+        index = bisect_right(self._deadlines, deadline)  # Appends when durations are equal
+        self._deadlines.insert(index, deadline)
+        self._by_deadline.insert(index, notification)
 
     def add_action_message(self, text: str, object_position: Tuple[int, int],
                           color: Tuple[int, int, int] = (255, 255, 0)) -> None:
@@ -74,44 +95,72 @@ class NotificationSystem:
 
     def update(self, delta_time: float) -> None:
         """Update all notifications"""
-        # Remove expired notifications
-        self.notifications = [n for n in self.notifications if not n.is_expired()]
+        # Remove expired notifications (one clock read for all of them)
+        now = time.monotonic()
+        expired_count = bisect_left(self._deadlines, now)
+        if expired_count:
+            expired = set(map(id, self._by_deadline[:expired_count]))
+            del self._deadlines[:expired_count]
+            del self._by_deadline[:expired_count]
+            self.notifications = [n for n in self.notifications if id(n) not in expired]
 
         # Update notification positions if needed
         # (Could be used for following moving objects)
 
     def render(self, renderer) -> None:
         """Render all active notifications"""
+        now = time.monotonic()
+        blit_sequence = []
         for notification in self.notifications:
-            alpha = notification.get_alpha()
+            alpha = notification.get_alpha(now)
             if alpha > 0:
-                # Create semi-transparent surface for fade effect
-                text_surface = self.font.render(notification.text, True, notification.color)
+                # Text rendered on first display, only its alpha changes afterwards (fade effect)
+                text_surface = notification._text_surface
+                if text_surface is None:
+                    text_surface = self.font.render(notification.text, True, notification.color)
+                    if pygame.display.get_surface() is not None:
+                        text_surface = text_surface.convert_alpha()
+                    notification._text_surface = text_surface
                 text_surface.set_alpha(alpha)
 
-                # Center the text
-                text_rect = text_surface.get_rect(center=notification.position)
+                if notification._text_pos is None:
+                    # Center the text
+                    text_rect = text_surface.get_rect(center=notification.position)
+
+                    # Render with background for better visibility
+                    bg_padding = 4
+                    bg_rect = text_rect.inflate(bg_padding * 2, bg_padding * 2)
+
+                    # Semi-transparent background
+                    if notification._bg_surface is None:
+                        notification._bg_surface = self._get_background(bg_rect.size)
+
+                    notification._text_pos = text_rect.topleft
+                    notification._bg_pos = bg_rect.topleft
 
-                # Render with background for better visibility
-                bg_padding = 4
-                bg_rect = pygame.Rect(
-                    text_rect.left - bg_padding,
-                    text_rect.top - bg_padding,
-                    text_rect.width + bg_padding * 2,
-                    text_rect.height + bg_padding * 2
-                )
+                blit_sequence.append((notification._bg_surface, notification._bg_pos))
+                blit_sequence.append((text_surface, notification._text_pos))
 
-                # Semi-transparent background
-                bg_surface = pygame.Surface((bg_rect.width, bg_rect.height))
-                bg_surface.set_alpha(128)
-                bg_surface.fill((0, 0, 0))
+        # Backgrounds and texts in one call, in the same order as individual blits
+        renderer.blit_surfaces(blit_sequence)
 
-                renderer.surface.blit(bg_surface, bg_rect)
-                renderer.surface.blit(text_surface, text_rect)
+    def _get_background(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Return the shared semi-transparent background for a given size"""
+        bg_surface = self._bg_cache.get(size)
+        if bg_surface is None:
+            # Per-pixel alpha in the display format rather than a surface-wide set_alpha
+            bg_surface = pygame.Surface(size, pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                bg_surface = bg_surface.convert_alpha()
+            bg_surface.fill((0, 0, 0, 128))
+            self._bg_cache[size] = bg_surface
+        return bg_surface
 
     def clear_all(self) -> None:
         """Clear all notifications"""
         self.notifications.clear()
+        self._deadlines.clear()
+        self._by_deadline.clear()
 
     def get_active_count(self) -> int:
         """Get number of active notifications"""
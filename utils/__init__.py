@@ -4,5 +4,7 @@ Utils module - Utility functions and helpers
 
 from .logger import GameLogger, get_logger
 from .config import ConfigManager
+from .fonts import get_font
+from .images import load_icon
 
-__all__ = ['GameLogger', 'get_logger', 'ConfigManager']
+__all__ = ['GameLogger', 'get_logger', 'ConfigManager', 'get_font', 'load_icon']
@@ -2,9 +2,75 @@
 Configuration management
 """
 
+import copy
 import json
 import os
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+
+# orjson is optional: faster encoder, json is used otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Marks a key missing from a cached parent dict (None is a valid setting value)
+_MISSING = object()
+
+
+def _serialize(config: Dict[str, Any]) -> bytes:
+    """Encode the configuration as indented UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _detached(value: Any) -> Any:
+    """Copy containers so callers never hold a live part of the configuration"""
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _split_path(key_path: str) -> Tuple[str, ...]:
+    """Split a dot-separated configuration path once per distinct path"""
+    return tuple(key_path.split('.'))
+
+
+# Default settings, shared by every ConfigManager (never mutated)
+_DEFAULTS: Dict[str, Any] = {
+    'window': {
+        'width': 800,
+        'height': 600,
+        'fullscreen': False,
+        'vsync': True
+    },
+    'audio': {
+        'master_volume': 1.0,
+        'music_volume': 0.7,
+        'sfx_volume': 0.8,
+        'mute': False
+    },
+    'gameplay': {
+        'language': 'fr',
+        'difficulty': 'normal',
+        'auto_save': True,
+        'save_interval': 300  # seconds
+    },
+    'controls': {
+        'mouse_sensitivity': 1.0,
+        'invert_mouse': False
+    },
+    'debug': {
+        'show_fps': False,
+        'show_hitboxes': False,
+        'log_level': 'INFO'
+    }
+}
+# Serialized once: json.loads of it gives an independent deep copy of the defaults
+_DEFAULTS_JSON = json.dumps(_DEFAULTS)
 
 
 class ConfigManager:
@@ -13,70 +79,72 @@ class ConfigManager:
     def __init__(self, config_file: str = "config.json"):
         self.config_file = config_file
         self.config: Dict[str, Any] = {}
-        self.defaults = {
-            'window': {
-                'width': 800,
-                'height': 600,
-                'fullscreen': False,
-                'vsync': True
-            },
-            'audio': {
-                'master_volume': 1.0,
-                'music_volume': 0.7,
-                'sfx_volume': 0.8,
-                'mute': False
-            },
-            'gameplay': {
-                'language': 'fr',
-                'difficulty': 'normal',
-                'auto_save': True,
-                'save_interval': 300  # seconds
-            },
-            'controls': {
-                'mouse_sensitivity': 1.0,
-                'invert_mouse': False
-            },
-            'debug': {
-                'show_fps': False,
-                'show_hitboxes': False,
-                'log_level': 'INFO'
-            }
-        }
+        # key_path -> (parent dict, final key) resolved by get(), cleared whenever the
+        # configuration structure may change
+        self._path_cache: Dict[str, Tuple[Dict[str, Any], str]] = {}
+        self.defaults = _DEFAULTS  # Shared, read-only: use _copy_defaults() for a mutable copy
+        # Unsaved changes since the last load/save, and the bytes last written
+        self._dirty = False
+        self._saved_data: Optional[bytes] = None
 
         self.load_config()
 
     def load_config(self) -> None:
         """Load configuration from file"""
+        self._path_cache.clear()
+        self._saved_data = None
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
-                self._merge_config(self.defaults, loaded_config)
+                with open(self.config_file, 'rb') as f:
+                    raw = f.read()
+                loaded_config = json.loads(raw.decode('utf-8'))
+                self._merge_config(loaded_config)
+                # What is on disk: saving an identical encoding is skipped
+                self._saved_data = raw
+                self._dirty = False
             except Exception as e:
                 print(f"Error loading config: {e}")
-                self.config = self.defaults.copy()
+                self.config = self._copy_defaults()
+                self._dirty = True
         else:
-            self.config = self.defaults.copy()
+            self.config = self._copy_defaults()
+            self._dirty = True
             self.save_config()
 
-    def _merge_config(self, defaults: Dict[str, Any], loaded: Dict[str, Any]) -> None:
+    def _copy_defaults(self) -> Dict[str, Any]:
+        """Deep copy of the defaults (nested sections are not shared with self.defaults)"""
+        return json.loads(_DEFAULTS_JSON)
+
+    def _merge_config(self, loaded: Dict[str, Any]) -> None:
         """Merge loaded config with defaults"""
-        self.config = defaults.copy()
+        self.config = self._copy_defaults()
         self._deep_merge(self.config, loaded)
 
     def _deep_merge(self, target: Dict[str, Any], source: Dict[str, Any]) -> None:
         """Deep merge two dictionaries"""
-        for key, value in source.items():
-            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                self._deep_merge(target[key], value)
-            else:
-                target[key] = value
+        # Explicit stack of (target, source) pairs instead of one recursive call per section
+        stack = [(target, source)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                target_value = target.get(key)
+                if isinstance(target_value, dict) and isinstance(value, dict):
+                    stack.append((target_value, value))
+                else:
+                    target[key] = value
 
     def save_config(self) -> bool:
-        """Save configuration to file"""
+        """Save configuration to file (skipped when nothing changed since the last load/save)"""
+        if not self._dirty:
+            return True
+
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            data = _serialize(self.config)
+            if data != self._saved_data:
+                with open(self.config_file, 'wb') as f:
+                    f.write(data)
+                self._saved_data = data
+            self._dirty = False
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -84,20 +152,33 @@ class ConfigManager:
 
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get configuration value by dot-separated path"""
-        keys = key_path.split('.')
+        cached = self._path_cache.get(key_path)
+        if cached is not None:
+            parent, key = cached
+            value = parent.get(key, _MISSING)
+            if value is not _MISSING:
+                return _detached(value)
+
+        keys = _split_path(key_path)
         value = self.config
+        parent = None
 
         for key in keys:
             if isinstance(value, dict) and key in value:
+                parent = value
                 value = value[key]
             else:
                 return default
 
-        return value
+        self._path_cache[key_path] = (parent, keys[-1])
+        return _detached(value)
 
     def set(self, key_path: str, value: Any) -> None:
         """Set configuration value by dot-separated path"""
-        keys = key_path.split('.')
+        # The value may replace a dict that cached paths point into
+        self._path_cache.clear()
+        self._dirty = True
+        keys = _split_path(key_path)
         config = self.config
 
         # Navigate to the parent of the target key
@@ -106,21 +187,25 @@ class ConfigManager:
                 config[key] = {}
             config = config[key]
 
-        # Set the value
-        config[keys[-1]] = value
+        # Set the value (a copy of containers, so later changes by the caller go through set)
+        config[keys[-1]] = _detached(value)
 
     def reset_to_defaults(self) -> None:
         """Reset configuration to defaults"""
-        self.config = self.defaults.copy()
+        self._path_cache.clear()
+        self._dirty = True
+        self.config = self._copy_defaults()
 
     def get_section(self, section: str) -> Dict[str, Any]:
-        """Get entire configuration section"""
-        return self.config.get(section, {})
+        """Get a copy of an entire configuration section (use set/set_section to change it)"""
+        return copy.deepcopy(self.config.get(section, {}))
 
     def set_section(self, section: str, values: Dict[str, Any]) -> None:
         """Set entire configuration section"""
-        self.config[section] = values
+        self._path_cache.clear()
+        self._dirty = True
+        self.config[section] = copy.deepcopy(values)
 
     def to_dict(self) -> Dict[str, Any]:
         """Get copy of entire configuration"""
-        return self.config.copy()
+        return copy.deepcopy(self.config)
@@ -0,0 +1,41 @@
+"""
+Font loading helpers shared by the renderer and the UI
+"""
+
+import pygame
+from typing import Dict, Optional, Tuple
+
+
+# Fonts shared by every caller, keyed by (resolved path, size, bold)
+_FONT_CACHE: Dict[Tuple[Optional[str], int, bool], pygame.font.Font] = {}
+# System font lookups, keyed by (family, bold); None means the default pygame font
+_FONT_PATHS: Dict[Tuple[str, bool], Optional[str]] = {}
+
+
+def _match_font(family: str, bold: bool) -> Optional[str]:
+    """Resolve a system font path once per family/weight"""
+    path_key = (family, bold)
+    if path_key not in _FONT_PATHS:
+        _FONT_PATHS[path_key] = pygame.font.match_font(family, bold=bold)
+    return _FONT_PATHS[path_key]
+
+
+def get_font(family: str, size: int, bold: bool = False) -> pygame.font.Font:
+    """Return a font, falling back to the default pygame font if the system one cannot be opened"""
+    if not pygame.font.get_init():
+        pygame.font.init()
+
+    path = _match_font(family, bold)
+    key = (path, size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        try:
+            font = pygame.font.Font(path, size)
+        except (pygame.error, OSError):
+            path = None
+            font = pygame.font.Font(None, size)
+        if bold and (path is None or path == _match_font(family, False)):
+            # No dedicated bold file: let pygame embolden the regular face
+            font.set_bold(True)
+        _FONT_CACHE[key] = font
+    return font
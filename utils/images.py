@@ -0,0 +1,30 @@
+"""
+Image loading helpers shared by the UI
+"""
+
+import pygame
+from typing import Dict, Optional
+
+
+# Decoded images keyed by file path; None records a file that could not be loaded
+_IMAGE_CACHE: Dict[str, Optional[pygame.Surface]] = {}
+
+
+def load_icon(path: str) -> Optional[pygame.Surface]:
+    """Return the image at path, decoding it only once per path
+
+    The surface is converted to the display format (convert_alpha) when a display
+    exists, so callers share one blit-ready surface. Returns None if the file cannot
+    be loaded.
+    """
+    if path in _IMAGE_CACHE:
+        return _IMAGE_CACHE[path]
+
+    try:
+        surface = pygame.image.load(path)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+    except (pygame.error, OSError):
+        surface = None
+    _IMAGE_CACHE[path] = surface
+    return surface
@@ -5,13 +5,17 @@ Logging system for the game
 import logging
 import logging.handlers
 import os
+from collections import deque
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
 
 class GameLogger:
     """Custom logger for the game with multiple output formats"""
 
+    # (log_file, level) the shared 'GameLogger' handlers were last set up for
+    _configured: Optional[Tuple[str, int]] = None
+
     def __init__(self, log_file: str = "game.log", level: str = "INFO"):
         self.log_file = log_file
         self.level = getattr(logging, level.upper(), logging.INFO)
@@ -23,9 +27,26 @@ class GameLogger:
 
         # Configure logger
         self.logger = logging.getLogger('GameLogger')
+
+        # Level methods are the stdlib ones (they already skip disabled levels), bound
+        # directly so calls do not go through a Python wrapper
+        self.debug = self.logger.debug
+        self.info = self.logger.info
+        self.warning = self.logger.warning
+        self.error = self.logger.error
+        self.critical = self.logger.critical
+
+        # Every instance shares the same stdlib logger: keep its handlers (and the open
+        # log file) when they were already set up for this file and level
+        config_key = (log_file, self.level)
+        if GameLogger._configured == config_key and self.logger.handlers:
+            return
+
         self.logger.setLevel(self.level)
 
         # Remove existing handlers
+        for handler in self.logger.handlers:
+            handler.close()
         self.logger.handlers.clear()
 
         # Create formatters
@@ -51,42 +72,22 @@ class GameLogger:
         # Add handlers
         self.logger.addHandler(file_handler)
         self.logger.addHandler(console_handler)
-
-    def debug(self, message: str, *args, **kwargs) -> None:
-        """Log debug message"""
-        self.logger.debug(message, *args, **kwargs)
-
-    def info(self, message: str, *args, **kwargs) -> None:
-        """Log info message"""
-        self.logger.info(message, *args, **kwargs)
-
-    def warning(self, message: str, *args, **kwargs) -> None:
-        """Log warning message"""
-        self.logger.warning(message, *args, **kwargs)
-
-    def error(self, message: str, *args, **kwargs) -> None:
-        """Log error message"""
-        self.logger.error(message, *args, **kwargs)
-
-    def critical(self, message: str, *args, **kwargs) -> None:
-        """Log critical message"""
-        self.logger.critical(message, *args, **kwargs)
+        GameLogger._configured = config_key
 
     def log_performance(self, operation: str, duration: float) -> None:
         """Log performance information"""
-        self.logger.info(f"Performance: {operation} took {duration:.3f}s")
+        self.logger.info("Performance: %s took %.3fs", operation, duration)
 
     def log_game_event(self, event_type: str, details: str = "") -> None:
         """Log game-specific events"""
-        message = f"Game Event: {event_type}"
         if details:
-            message += f" - {details}"
-        self.logger.info(message)
+            self.logger.info("Game Event: %s - %s", event_type, details)
+        else:
+            self.logger.info("Game Event: %s", event_type)
 
     def log_error_with_context(self, error: Exception, context: str = "") -> None:
         """Log error with additional context"""
-        error_msg = f"Error in {context}: {str(error)}"
-        self.logger.error(error_msg, exc_info=True)
+        self.logger.error("Error in %s: %s", context, error, exc_info=True)
 
     def set_level(self, level: str) -> None:
         """Change logging level"""
@@ -94,6 +95,7 @@ class GameLogger:
         self.logger.setLevel(self.level)
         for handler in self.logger.handlers:
             handler.setLevel(self.level)
+        GameLogger._configured = (self.log_file, self.level)
 
     def get_recent_logs(self, lines: int = 50) -> list:
         """Get recent log entries"""
@@ -102,8 +104,8 @@ class GameLogger:
 
         try:
             with open(self.log_file, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
-                return all_lines[-lines:] if len(all_lines) > lines else all_lines
+                # Stream the file, keeping only the last lines in memory
+                return list(deque(f, maxlen=lines))
         except Exception as e:
             self.logger.error(f"Error reading log file: {e}")
             return []
@@ -121,6 +123,8 @@ class GameLogger:
 
 # Global logger instance
 logger = GameLogger()
+# Underlying stdlib logger, for hot paths such as the log_function_call wrapper
+_stdlog = logger.logger
 
 
 def get_logger() -> GameLogger:
@@ -132,13 +136,13 @@ def log_function_call(func_name: str):
     """Decorator to log function calls"""
     def decorator(func):
         def wrapper(*args, **kwargs):
-            logger.debug(f"Calling {func_name}")
+            _stdlog.debug("Calling %s", func_name)
             try:
                 result = func(*args, **kwargs)
-                logger.debug(f"Function {func_name} completed successfully")
+                _stdlog.debug("Function %s completed successfully", func_name)
                 return result
             except Exception as e:
-                logger.error(f"Function {func_name} failed: {e}")
+                _stdlog.error("Function %s failed: %s", func_name, e)
                 raise
         return wrapper
     return decorator